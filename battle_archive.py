@@ -0,0 +1,259 @@
+"""
+Append-only, compressed archive of battle logs (the frames replay.LogRecorder captures).
+
+Battles are buffered until chunk_size bytes of logs, chunk_battles battles or chunk_seconds
+since the first of them have built up and then appended as one zlib-compressed chunk, so
+the compressor also finds what battles repeat from one another (protocol lines, species,
+whole sets in requests), not only what each repeats within itself. Every chunk carries its
+own uncompressed index of the battles in it, so a reader builds the battle tag -> (chunk,
+offset) index from the chunk headers alone, fetches one battle by decompressing just its
+chunk, and streams the whole archive holding one chunk at a time.
+
+File layout (little endian):
+    magic (8 bytes) | version (u32) | chunks
+A chunk is `_CHUNK` (compressed length, log length, index length), a JSON index of
+[battle tag, log length] pairs in log order and the compressed logs, concatenated.
+A crash loses the battles still buffered; a chunk cut short by one is dropped when the archive
+is next opened for writing.
+
+    python battle_archive.py archive [battle tag]
+
+prints the archive's size and compression, or one battle's log.
+"""
+
+import json
+import os
+import struct
+import sys
+import time
+import zlib
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from replay import frames
+
+MAGIC = b"PSBLOGS\x00"
+VERSION = 1
+CHUNK_SIZE = 1 << 20
+# a chunk is also written after this many battles or seconds, bounding what a crash loses
+CHUNK_BATTLES = 64
+CHUNK_SECONDS = 60.0
+
+_PREAMBLE = struct.Struct("<8sI")
+_CHUNK = struct.Struct("<III")
+
+
+class ArchiveEntry(NamedTuple):
+    chunk: int  # file offset of the chunk
+    start: int  # offset of the log in the chunk's decompressed logs
+    length: int
+
+
+class ChunkHeader(NamedTuple):
+    offset: int
+    compressed_length: int
+    log_length: int
+    index_length: int
+    battles: list[tuple[str, int]]
+
+    @property
+    def payload(self) -> int:
+        return self.offset + _CHUNK.size + self.index_length
+
+    @property
+    def end(self) -> int:
+        return self.payload + self.compressed_length
+
+
+def _read_preamble(f: BinaryIO, path: str):
+    data = f.read(_PREAMBLE.size)
+    if len(data) != _PREAMBLE.size:
+        raise ValueError(f"{path} is not a version {VERSION} battle archive")
+    magic, version = _PREAMBLE.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} battle archive")
+
+
+def _chunk_header(f: BinaryIO, offset: int) -> ChunkHeader:
+    f.seek(offset)
+    compressed_length, log_length, index_length = _CHUNK.unpack(f.read(_CHUNK.size))
+    battles = [(battle_tag, length) for battle_tag, length in json.loads(f.read(index_length))]
+    return ChunkHeader(offset, compressed_length, log_length, index_length, battles)
+
+
+def _chunk_headers(f: BinaryIO) -> Iterator[ChunkHeader]:
+    """
+    Headers of the complete chunks, from just after the preamble; stops at a cut short one
+    """
+    size = os.fstat(f.fileno()).st_size
+    offset = _PREAMBLE.size
+    while offset + _CHUNK.size <= size:
+        f.seek(offset)
+        compressed_length, _, index_length = _CHUNK.unpack(f.read(_CHUNK.size))
+        if offset + _CHUNK.size + index_length + compressed_length > size:
+            return
+        header = _chunk_header(f, offset)
+        yield header
+        offset = header.end
+
+
+class BattleArchiveWriter:
+    def __init__(
+        self,
+        path: str,
+        chunk_size: int = CHUNK_SIZE,
+        level: int = 6,
+        chunk_battles: int = CHUNK_BATTLES,
+        chunk_seconds: float = CHUNK_SECONDS,
+    ):
+        """
+        Appends to the archive at path, creating it if needed; level is zlib's
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.level = level
+        self.chunk_battles = chunk_battles
+        self.chunk_seconds = chunk_seconds
+        self._logs: list[bytes] = []
+        self._battles: list[tuple[str, int]] = []
+        self._buffered = 0
+        self._first = 0.0
+        if os.path.exists(path) and os.path.getsize(path):
+            self._file = open(path, "r+b")
+            _read_preamble(self._file, path)
+            end = _PREAMBLE.size
+            for header in _chunk_headers(self._file):
+                end = header.end
+            self._file.truncate(end)
+            self._file.seek(end)
+        else:
+            self._file = open(path, "wb")
+            self._file.write(_PREAMBLE.pack(MAGIC, VERSION))
+
+    def __enter__(self) -> "BattleArchiveWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(self, battle_tag: str, battle_frames: list[str]):
+        """
+        Adds one battle's log; a replay.LogSink
+        """
+        log = "\n".join(battle_frames).encode()
+        if not self._logs:
+            self._first = time.monotonic()
+        self._logs.append(log)
+        self._battles.append((battle_tag, len(log)))
+        self._buffered += len(log)
+        if (
+            self._buffered >= self.chunk_size
+            or len(self._battles) >= self.chunk_battles
+            or time.monotonic() - self._first >= self.chunk_seconds
+        ):
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered battles out as a chunk
+        """
+        if not self._logs:
+            return
+        logs = b"".join(self._logs)
+        compressed = zlib.compress(logs, self.level)
+        index = json.dumps(self._battles, separators=(",", ":")).encode()
+        self._file.write(_CHUNK.pack(len(compressed), len(logs), len(index)) + index + compressed)
+        self._file.flush()
+        self._logs, self._battles, self._buffered = [], [], 0
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+class BattleArchive:
+    def __init__(self, path: str):
+        """
+        Reads the archive at path; the index is built on first use from the chunk headers
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        _read_preamble(self._file, path)
+        self._index: Optional[dict[str, ArchiveEntry]] = None
+        # the last chunk decompressed, as lookups by tag tend to hit the same chunk
+        self._chunk: tuple[int, bytes] = (-1, b"")
+
+    def __enter__(self) -> "BattleArchive":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self._file.close()
+
+    def chunks(self) -> list[ChunkHeader]:
+        return list(_chunk_headers(self._file))
+
+    @property
+    def index(self) -> dict[str, ArchiveEntry]:
+        if self._index is None:
+            self._index = {}
+            for header in _chunk_headers(self._file):
+                start = 0
+                for battle_tag, length in header.battles:
+                    self._index[battle_tag] = ArchiveEntry(header.offset, start, length)
+                    start += length
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, battle_tag: str) -> bool:
+        return battle_tag in self.index
+
+    def _logs(self, header: ChunkHeader) -> bytes:
+        if self._chunk[0] != header.offset:
+            self._file.seek(header.payload)
+            self._chunk = (header.offset, zlib.decompress(self._file.read(header.compressed_length)))
+        return self._chunk[1]
+
+    def get(self, battle_tag: str) -> list[str]:
+        """
+        The frames of the battle battle_tag
+        """
+        entry = self.index[battle_tag]
+        log = self._logs(_chunk_header(self._file, entry.chunk))[entry.start : entry.start + entry.length]
+        return list(frames(log.decode().split("\n")))
+
+    def battles(self) -> Iterator[tuple[str, list[str]]]:
+        """
+        Every battle tag and its frames, in the order they were archived, decompressing
+        one chunk at a time
+        """
+        for header in _chunk_headers(self._file):
+            logs = self._logs(header)
+            start = 0
+            for battle_tag, length in header.battles:
+                yield battle_tag, list(frames(logs[start : start + length].decode().split("\n")))
+                start += length
+
+    def logs(self) -> Iterator[list[str]]:
+        """
+        Every battle's frames, e.g. for replay.ReplayHarness.replay_many
+        """
+        return (battle_frames for _, battle_frames in self.battles())
+
+
+if __name__ == "__main__":
+    with BattleArchive(sys.argv[1]) as archive:
+        if len(sys.argv) > 2:
+            print("\n".join(archive.get(sys.argv[2])))
+        else:
+            chunks = archive.chunks()
+            logs = sum(header.log_length for header in chunks)
+            size = os.path.getsize(archive.path)
+            print(
+                f"{len(archive)} battles in {len(chunks)} chunks: {logs / 1e6:.1f} MB of logs "
+                f"stored in {size / 1e6:.1f} MB ({logs / size if size else 0:.1f}x)"
+            )
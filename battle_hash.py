@@ -0,0 +1,117 @@
+"""
+Zobrist hashing of the battle abstraction the search works on.
+
+Per side and team position a state records the HP bucket, status, stat boosts, which slot
+the mon is active in, whether it terastallized, whether it can still Fake Out and its
+Protect chain; on top of that the weather and terrain, Trick Room and each side's Tailwind,
+each with the turns it has left. Every
+(feature, value) pair owns a fixed random 63 bit key (so hashes fit int64 arrays) and a
+state hashes to the XOR of the keys of its values, so a model can update the hash of a
+state with two XORs per change. The forward model (battle_model.DoublesModel.state_key)
+hashes its states with ZOBRIST.
+Neutral values (no status, +0, benched, no weather) have key 0 and cost nothing.
+"""
+
+import numpy as np
+from poke_env.battle import Field, SideCondition, Status, Weather
+
+from team_catalog import TEAM_SIZE
+
+SIDES = 2
+HP_BUCKETS = 10
+BOOSTS = ("atk", "def", "spa", "spd", "spe", "accuracy", "evasion")
+MAX_BOOST = 6
+# benched, active in slot 0, active in slot 1
+POSITIONS = 3
+# consecutive Protects past this one are hashed as this many: the odds are 1/27 by then
+MAX_PROTECT_CHAIN = 3
+# turns left of weather, terrain, Trick Room and Tailwind
+MAX_TURNS = 8
+
+
+def hp_bucket(fraction: float) -> int:
+    """
+    0 when fainted, else 1 to HP_BUCKETS
+    """
+    if fraction <= 0:
+        return 0
+    return 1 + min(HP_BUCKETS - 1, int(fraction * HP_BUCKETS))
+
+
+class ZobristKeys:
+    def __init__(self, seed: int = 0x5EED):
+        rng = np.random.default_rng(seed)
+
+        def table(*shape: int) -> np.ndarray:
+            return rng.integers(0, 1 << 63, size=shape, dtype=np.int64)
+
+        hp = table(SIDES, TEAM_SIZE, HP_BUCKETS + 1)
+        status = table(SIDES, TEAM_SIZE, len(Status) + 1)
+        status[..., 0] = 0
+        boost = table(SIDES, TEAM_SIZE, len(BOOSTS), 2 * MAX_BOOST + 1)
+        boost[..., MAX_BOOST] = 0
+        position = table(SIDES, TEAM_SIZE, POSITIONS)
+        position[..., 0] = 0
+        weather = table(len(Weather) + 1)
+        weather[0] = 0
+        protect_chain = table(SIDES, TEAM_SIZE, MAX_PROTECT_CHAIN + 1)
+        protect_chain[..., 0] = 0
+        turns = table(len(Weather) + len(Field) + SIDES + 2, MAX_TURNS + 1)
+        turns[:, 0] = 0
+
+        # nested lists of Python ints: XORs on ints are much cheaper than on NumPy scalars
+        self.hp: list = hp.tolist()
+        self.status: list = status.tolist()
+        self.boost: list = boost.tolist()
+        self.position: list = position.tolist()
+        self.tera: list = table(SIDES, TEAM_SIZE).tolist()
+        self.fake_out: list = table(SIDES, TEAM_SIZE).tolist()
+        self.protect_chain: list = protect_chain.tolist()
+        self.weather: list = weather.tolist()
+        self.field: list = table(len(Field) + 1).tolist()
+        self.side_condition: list = table(SIDES, len(SideCondition) + 1).tolist()
+        # by turns left: weather_turns[weather], field_turns[field], side_condition_turns[side]
+        turns = turns.tolist()
+        self.weather_turns: list = turns[: len(Weather) + 1]
+        self.field_turns: list = turns[len(Weather) + 1 : len(Weather) + len(Field) + 2]
+        self.side_condition_turns: list = turns[len(Weather) + len(Field) + 2 :]
+
+    def turns(self, keys: list, turns: int) -> int:
+        """
+        Key of turns left among keys, a row of weather_turns, field_turns or
+        side_condition_turns
+        """
+        return keys[min(turns, MAX_TURNS)]
+
+    def mon(
+        self,
+        side: int,
+        index: int,
+        hp: int,
+        status: int = 0,
+        boosts: tuple[int, ...] = (0,) * len(BOOSTS),
+        position: int = 0,
+        terastallized: bool = False,
+        fake_out: bool = False,
+        protect_chain: int = 0,
+    ) -> int:
+        """
+        Hash of one team member: hp is its bucket, status a Status value or 0, boosts in
+        BOOSTS order, position one of POSITIONS, fake_out whether an active mon is on its
+        first turn out and protect_chain its consecutive Protects
+        """
+        key = self.hp[side][index][hp] ^ self.status[side][index][status] ^ self.position[side][index][position]
+        if any(boosts):
+            boost_keys = self.boost[side][index]
+            for stat, boost in enumerate(boosts):
+                key ^= boost_keys[stat][boost + MAX_BOOST]
+        if terastallized:
+            key ^= self.tera[side][index]
+        if fake_out:
+            key ^= self.fake_out[side][index]
+        if protect_chain:
+            key ^= self.protect_chain[side][index][min(protect_chain, MAX_PROTECT_CHAIN)]
+        return key
+
+
+ZOBRIST = ZobristKeys()
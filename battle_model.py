@@ -0,0 +1,1017 @@
+"""
+Approximate gen 9 doubles forward model for search, seeded from a poke_env DoubleBattle.
+
+A state is a BattleState, a flat list of small ints laid out by the offsets below with an
+undo stack. step() resolves a turn on a copy; make() resolves it in place after pushing an
+undo frame and unmake() restores it, so a search walks one state down the tree and back
+without allocating once the frame buffers exist. What does not change during a battle (stats, types, moves) is
+kept once in the model. A turn resolves switches, then tera, then moves by priority and speed
+(Tailwind doubles speed, Trick Room reverses the order), with spread moves at 0.75,
+Protect at 1/3 ** (consecutive uses) odds, Fake Out only on the first turn out, weather,
+terrain, tera STAB and tera defensive typing; then residual chip and automatic replacement
+of fainted mons. Abilities, items, secondary effects and most status moves are ignored.
+
+evaluate_many() plays the rollouts of a batch of states together, one turn of every state
+per round of NumPy ops, with a simpler rollout policy (random moves, no switches or tera).
+
+Action ids are DoublesEnv's slot actions, packed as first * SLOT_ACTIONS + second.
+"""
+
+import functools
+import itertools
+import operator
+import random
+from typing import NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+from poke_env.battle import DoubleBattle, Field, Move, Pokemon, PokemonType, SideCondition, Status, Weather
+from poke_env.battle.move import Target
+from poke_env.data import GenData, to_id_str
+
+from battle_hash import HP_BUCKETS, ZOBRIST, hp_bucket
+from team_catalog import TEAM_SIZE
+
+SLOT_ACTIONS = 107
+# DoublesEnv slot actions: 0 passes, 1-6 switch to a team member, then moves as
+# 7 + 5 * move + (target + 2) + 20 * gimmick, gimmick 4 being tera (87-106)
+SWITCHES = range(1, 7)
+MOVE_ACTIONS = 7
+GIMMICK_ACTIONS = 20
+TERA_MOVES = range(MOVE_ACTIONS + 4 * GIMMICK_ACTIONS, SLOT_ACTIONS)
+
+SIDES = 2
+# Pokemon brought to a VGC battle, used to pad the opponent's revealed team from preview
+BRING = 4
+
+# fields of a team member
+HP, STATUS, ATK, DEF, SPA, SPD, SPE, POSITION, TERA, TURNS_OUT, PROTECT_CHAIN = range(11)
+MON_FIELDS = 11
+# fields of a side: the team index active in each slot (-1 for none), tera used, Tailwind turns
+ACTIVE, TERA_USED, TAILWIND = 0, 2, 3
+SIDE_FIELDS = 4
+SIDE_BASE = SIDES * TEAM_SIZE * MON_FIELDS
+FIELD_BASE = SIDE_BASE + SIDES * SIDE_FIELDS
+WEATHER, WEATHER_TURNS, TERRAIN, TERRAIN_TURNS, TRICK_ROOM, TURN = range(FIELD_BASE, FIELD_BASE + 6)
+STATE_SIZE = FIELD_BASE + 6
+
+PHYSICAL, SPECIAL, STATUS_MOVE = range(3)
+SINGLE, FOES, ADJACENT = range(3)
+NO_EFFECT, PROTECT, FAKE_OUT, TRICK_ROOM_MOVE, TAILWIND_MOVE = range(5)
+
+# enum values as plain ints: Enum.value is a descriptor call, too slow for the turn loop
+_BRN, _PAR, _SLP, _FRZ, _FNT = (s.value for s in (Status.BRN, Status.PAR, Status.SLP, Status.FRZ, Status.FNT))
+_POISONED = (Status.PSN.value, Status.TOX.value)
+_SAND = Weather.SANDSTORM.value
+_GRASSY, _MISTY, _TRICK_ROOM = Field.GRASSY_TERRAIN.value, Field.MISTY_TERRAIN.value, Field.TRICK_ROOM.value
+_TAILWIND = SideCondition.TAILWIND.value
+_DRAGON = PokemonType.DRAGON.value
+
+_BOOST = [max(2, 2 + boost) / max(2, 2 - boost) for boost in range(-6, 7)]
+_WEATHER_BOOST = {
+    (Weather.SUNNYDAY.value, PokemonType.FIRE.value): 1.5,
+    (Weather.SUNNYDAY.value, PokemonType.WATER.value): 0.5,
+    (Weather.RAINDANCE.value, PokemonType.WATER.value): 1.5,
+    (Weather.RAINDANCE.value, PokemonType.FIRE.value): 0.5,
+}
+_TERRAIN_BOOST = {
+    Field.ELECTRIC_TERRAIN.value: PokemonType.ELECTRIC.value,
+    Field.GRASSY_TERRAIN.value: PokemonType.GRASS.value,
+    Field.PSYCHIC_TERRAIN.value: PokemonType.PSYCHIC.value,
+}
+_SAND_IMMUNE = {PokemonType.ROCK.value, PokemonType.GROUND.value, PokemonType.STEEL.value}
+_EFFECTS = {"fakeout": FAKE_OUT, "trickroom": TRICK_ROOM_MOVE, "tailwind": TAILWIND_MOVE}
+_SPREAD = {Target.ALL_ADJACENT_FOES: FOES, Target.ALL_ADJACENT: ADJACENT}
+
+
+class BattleState(list):
+    """
+    Flat battle state with an undo stack: push() saves the current values into a frame
+    buffer (reused by later pushes at the same depth) and undo() restores one, both as
+    C level slice copies. Logging single writes through a Python __setitem__ costs more
+    than these copies of a state this small.
+    """
+
+    __slots__ = ("frames", "depth")
+
+    def __init__(self, values: Sequence[int] = ()):
+        super().__init__(values)
+        self.frames: list[list[int]] = []
+        self.depth = 0
+
+    def push(self) -> int:
+        """
+        Saves the state and returns the mark to undo() back to it
+        """
+        if self.depth == len(self.frames):
+            self.frames.append(list(self))
+        else:
+            self.frames[self.depth][:] = self
+        self.depth += 1
+        return self.depth - 1
+
+    def undo(self, mark: int):
+        self[:] = self.frames[mark]
+        self.depth = mark
+
+
+def mon_offset(side: int, index: int) -> int:
+    return (side * TEAM_SIZE + index) * MON_FIELDS
+
+
+def side_offset(side: int) -> int:
+    return SIDE_BASE + side * SIDE_FIELDS
+
+
+class MoveData(NamedTuple):
+    power: int
+    type: int  # PokemonType value
+    category: int
+    priority: int
+    accuracy: float
+    spread: int
+    effect: int
+
+
+class MonData(NamedTuple):
+    species: str
+    level: int
+    max_hp: int
+    stats: tuple[int, int, int, int, int]  # atk, def, spa, spd, spe
+    types: tuple[int, ...]
+    tera_type: int
+    moves: tuple[MoveData, ...]
+
+
+def _effectiveness() -> list[list[float]]:
+    # [attacking type][defending type] by PokemonType value, 1 for the types outside the chart
+    chart = GenData.from_gen(9).type_chart
+    table = [[1.0] * (len(PokemonType) + 1) for _ in range(len(PokemonType) + 1)]
+    for defending, row in chart.items():
+        for attacking, multiplier in row.items():
+            table[PokemonType.from_name(attacking).value][PokemonType.from_name(defending).value] = multiplier
+    return table
+
+
+_effectiveness_table: list[list[float]] = []
+
+# state columns as arrays for batched rollouts: (MON_FIELDS, SIDES, TEAM_SIZE) and (SIDES, 2)
+_MON_COLUMNS = np.array(
+    [[[mon_offset(side, index) + field for index in range(TEAM_SIZE)] for side in range(SIDES)] for field in range(MON_FIELDS)]
+)
+_ACTIVE_COLUMNS = np.array([[side_offset(side) + ACTIVE + slot for slot in range(2)] for side in range(SIDES)])
+_TAILWIND_COLUMNS = np.array([side_offset(side) + TAILWIND for side in range(SIDES)])
+_BOOST_ARRAY = np.array(_BOOST)
+# side and slot of the four movers of a turn, in _ACTIVE_COLUMNS order
+_MOVER_SIDE = np.array([0, 0, 1, 1])
+_MOVER_SLOT = np.array([0, 1, 0, 1])
+
+
+class BatchTables(NamedTuple):
+    """
+    A model's static data as arrays indexed by [side, team index]
+    """
+
+    present: np.ndarray  # (2, 6) bool
+    max_hp: np.ndarray  # (2, 6), 1 for absent mons
+    stats: np.ndarray  # (2, 6, 5)
+    level: np.ndarray  # (2, 6)
+    types: np.ndarray  # (2, 6, 2) PokemonType values, 0 for none
+    tera_type: np.ndarray  # (2, 6)
+    sand_immune: np.ndarray  # (2, 6) bool
+    n_moves: np.ndarray  # (2, 6)
+    moves: np.ndarray  # (2, 6, 4, len(MoveData._fields)) padded with the first move
+    effectiveness: np.ndarray  # [attacking type, defending type]
+    weather: np.ndarray  # [weather, move type] damage multiplier
+    terrain: np.ndarray  # [terrain, move type] damage multiplier
+
+
+def move_data(move: Move) -> MoveData:
+    if move.is_protect_move:
+        effect = PROTECT
+    else:
+        effect = _EFFECTS.get(move.id, NO_EFFECT)
+    category = {"PHYSICAL": PHYSICAL, "SPECIAL": SPECIAL}.get(move.category.name, STATUS_MOVE)
+    accuracy = 1.0 if move.accuracy is True else float(move.accuracy)
+    return MoveData(
+        move.base_power, move.type.value, category, move.priority, accuracy, _SPREAD.get(move.target, SINGLE), effect
+    )
+
+
+def estimate_stats(mon: Pokemon) -> tuple[int, tuple[int, int, int, int, int]]:
+    """
+    Max HP and stats at the mon's level with 31 IVs, no EVs and a neutral nature
+    """
+    base, level = mon.base_stats, mon.level
+    max_hp = (2 * base["hp"] + 31) * level // 100 + level + 10
+    stats = tuple((2 * base[stat] + 31) * level // 100 + 5 for stat in ("atk", "def", "spa", "spd", "spe"))
+    return max_hp, stats
+
+
+def mon_data(mon: Pokemon, own: bool) -> MonData:
+    """
+    Static data of a team member: real stats for our own mons, estimates for the opponent's
+    """
+    max_hp, stats = estimate_stats(mon)
+    if own and mon.stats.get("atk") is not None:
+        max_hp = mon.max_hp or max_hp
+        stats = tuple(mon.stats[stat] for stat in ("atk", "def", "spa", "spd", "spe"))
+    types = tuple(t.value for t in (mon.type_1, mon.type_2) if t is not None)
+    moves = tuple(move_data(move) for move in list(mon.moves.values())[:4])
+    if not moves:
+        # nothing revealed yet: a plain 80 power STAB attack from the better attacking stat
+        category = PHYSICAL if stats[0] >= stats[2] else SPECIAL
+        moves = (MoveData(80, types[0], category, 0, 1.0, SINGLE, NO_EFFECT),)
+    tera_type = mon.tera_type.value if mon.tera_type is not None else types[0]
+    return MonData(mon.species, mon.level, max_hp, stats, types, tera_type, moves)
+
+
+def opponent_team(battle: DoubleBattle) -> tuple[list[Pokemon], frozenset[int]]:
+    """
+    The opponent's team at indices fixed for the whole battle, and the indices the model
+    leaves out. With a team preview every previewed mon keeps its place in species order and
+    a revealed mon takes its previewed one's; of the mons not yet revealed, those past BRING
+    mons in all are left out. Without one, mons are in the order they were revealed.
+    """
+    revealed = list(battle.opponent_team.values())[:TEAM_SIZE]
+    team = sorted(battle.teampreview_opponent_team, key=lambda mon: mon.species)[:TEAM_SIZE]
+    if not team:
+        return revealed, frozenset()
+    previewed = [to_id_str(mon.species) for mon in team]
+    placed = [False] * len(team)
+    for mon in revealed:
+        species = to_id_str(mon.species)
+        # previews show some formes by their base species, e.g. Urshifu-*
+        index = next((i for i, p in enumerate(previewed) if not placed[i] and p == species), None)
+        if index is None:
+            index = next((i for i, p in enumerate(previewed) if not placed[i] and species.startswith(p)), None)
+        if index is None:
+            # not previewed (Illusion): the last unrevealed place
+            index = next((i for i in reversed(range(len(team))) if not placed[i]), None)
+            if index is None:
+                continue
+        team[index] = mon
+        placed[index] = True
+    unrevealed = [i for i in range(len(team)) if not placed[i]]
+    return team, frozenset(unrevealed[max(0, BRING - sum(placed)) :])
+
+
+def _remaining(start: int, turn: int, duration: int) -> int:
+    return max(1, duration - (turn - start))
+
+
+def factor(action: int) -> tuple[int, int]:
+    return divmod(action, SLOT_ACTIONS)
+
+
+def join(first: int, second: int) -> int:
+    return first * SLOT_ACTIONS + second
+
+
+def compatible(first: int, second: int) -> bool:
+    # the pairs DoubleBattleOrder.join_orders drops
+    if first in TERA_MOVES and second in TERA_MOVES:
+        return False
+    return not (first == second and first in SWITCHES)
+
+
+class DoublesModel:
+    """
+    Search model over the forward model: we pick joint actions, the opponent answers with
+    random legal ones, outcome keys are Zobrist hashes of the resulting states and leaves
+    are valued by rollout_turns random turns followed by the share of HP left on our side
+    """
+
+    def __init__(
+        self,
+        battle: DoubleBattle,
+        root_actions: Optional[Sequence[int]] = None,
+        root_priors: Optional[Sequence[float]] = None,
+        rollout_turns: int = 2,
+        damage_memo_size: int = 1 << 14,
+    ):
+        """
+        root_actions (and their root_priors) replace the model's own legal actions at the root,
+        e.g. with the agent's exact orders; damage_memo_size bounds the damage memo, which
+        is emptied when full
+        """
+        global _effectiveness_table
+        if not _effectiveness_table:
+            _effectiveness_table = _effectiveness()
+        self.effectiveness = _effectiveness_table
+        ours = list(battle.team.values())[:TEAM_SIZE]
+        # opponent mons keep their index (and so their Zobrist keys) from turn to turn; left
+        # out ones are seeded fainted
+        theirs, self.left_out = opponent_team(battle)
+        self.teams = (tuple(mon_data(mon, own=True) for mon in ours), tuple(mon_data(mon, own=False) for mon in theirs))
+        self.root = self._seed(battle, (ours, theirs))
+        self.root_actions = list(root_actions) if root_actions is not None else None
+        self.root_priors = list(root_priors) if root_priors is not None else None
+        self.rollout_turns = rollout_turns
+        self._batch_tables: Optional[BatchTables] = None
+        self.damage_memo_size = damage_memo_size
+        self._damage_memo: dict[tuple, float] = {}
+
+    def _seed(self, battle: DoubleBattle, teams: tuple[list[Pokemon], list[Pokemon]]) -> BattleState:
+        state = [0] * STATE_SIZE
+        turn = battle.turn
+        sides = (
+            (battle.active_pokemon, battle.used_tera, battle.side_conditions),
+            (battle.opponent_active_pokemon, battle.opponent_used_tera, battle.opponent_side_conditions),
+        )
+        for side, (active, used_tera, conditions) in enumerate(sides):
+            s = side_offset(side)
+            state[s + ACTIVE] = state[s + ACTIVE + 1] = -1
+            for index, mon in enumerate(teams[side]):
+                o = mon_offset(side, index)
+                data = self.teams[side][index]
+                if mon.fainted or (side == 1 and index in self.left_out):
+                    state[o + HP] = 0
+                else:
+                    state[o + HP] = max(1, round(mon.current_hp_fraction * data.max_hp))
+                state[o + STATUS] = mon.status.value if mon.status is not None else 0
+                for field, stat in zip(range(ATK, SPE + 1), ("atk", "def", "spa", "spd", "spe")):
+                    state[o + field] = mon.boosts.get(stat, 0)
+                state[o + TERA] = int(mon.is_terastallized)
+                state[o + TURNS_OUT] = 0 if mon.first_turn else 1
+                state[o + PROTECT_CHAIN] = mon.protect_counter
+                for slot, other in enumerate(active):
+                    if other is mon and not mon.fainted:
+                        state[o + POSITION] = slot + 1
+                        state[s + ACTIVE + slot] = index
+            state[s + TERA_USED] = int(used_tera)
+            if SideCondition.TAILWIND in conditions:
+                state[s + TAILWIND] = _remaining(conditions[SideCondition.TAILWIND], turn, 4)
+        for weather, start in battle.weather.items():
+            state[WEATHER] = weather.value
+            state[WEATHER_TURNS] = _remaining(start, turn, 5)
+        for field, start in battle.fields.items():
+            if field == Field.TRICK_ROOM:
+                state[TRICK_ROOM] = _remaining(start, turn, 5)
+            elif field.is_terrain:
+                state[TERRAIN] = field.value
+                state[TERRAIN_TURNS] = _remaining(start, turn, 5)
+        state[TURN] = turn
+        return BattleState(state)
+
+    # SearchModel
+
+    def _at_root(self, state: BattleState) -> bool:
+        # searched in place, the root object also holds deeper states, with pushed frames
+        return state is self.root and not state.depth
+
+    def legal_actions(self, state: BattleState) -> list[int]:
+        if self.root_actions is not None and self._at_root(state):
+            return self.root_actions
+        firsts, seconds = self.slot_actions(state, 0, 0), self.slot_actions(state, 0, 1)
+        return [join(first, second) for first in firsts for second in seconds if compatible(first, second)]
+
+    def priors(self, state: BattleState, actions: Sequence[int]) -> Optional[list[float]]:
+        if self.root_priors is not None and actions is self.root_actions and self._at_root(state):
+            return self.root_priors
+        return None
+
+    def step(self, state: BattleState, action: int) -> tuple[BattleState, int]:
+        values = list(state)
+        self.play_turn(values, factor(action), self.random_actions(values, 1))
+        return BattleState(values), self.state_key(values)
+
+    def terminal_value(self, state: BattleState) -> Optional[float]:
+        ours, theirs = self.alive(state, 0), self.alive(state, 1)
+        if ours and theirs:
+            return None
+        return 0.5 if ours == theirs else float(ours > theirs)
+
+    def evaluate(self, state: BattleState) -> float:
+        mark = state.push()
+        for _ in range(self.rollout_turns):
+            if self.terminal_value(state) is not None:
+                break
+            self.play_turn(state, self.random_actions(state, 0), self.random_actions(state, 1))
+        ours, theirs = self.hp_share(state, 0), self.hp_share(state, 1)
+        state.undo(mark)
+        return ours / (ours + theirs) if ours + theirs else 0.5
+
+    # InPlaceModel
+
+    def make(self, state: BattleState, action: int) -> tuple[int, int]:
+        """
+        step() on state itself; returns the outcome key and the mark to unmake it with
+        """
+        mark = state.push()
+        self.play_turn(state, factor(action), self.random_actions(state, 1))
+        return self.state_key(state), mark
+
+    def unmake(self, state: BattleState, mark: int):
+        state.undo(mark)
+
+    def snapshot(self, state: BattleState) -> BattleState:
+        return BattleState(state)
+
+    # BatchedModel
+
+    def evaluate_many(self, states: Sequence[BattleState]) -> list[float]:
+        """
+        evaluate() of every state, with the rollouts of all of them played together: each
+        turn is a few NumPy ops over the whole batch for every mover and target position
+        """
+        batch = np.array(states, dtype=np.int64).reshape(len(states), STATE_SIZE)
+        tables = self.batch_tables()
+        rng = np.random.default_rng(random.getrandbits(64))
+        for _ in range(self.rollout_turns):
+            hp = batch[:, _MON_COLUMNS[HP]]
+            live = np.flatnonzero((hp[:, 0] > 0).any(axis=1) & (hp[:, 1] > 0).any(axis=1))
+            if not len(live):
+                break
+            rows = batch[live]
+            self._batch_turn(rows, tables, rng)
+            batch[live] = rows
+        share = (batch[:, _MON_COLUMNS[HP]] / tables.max_hp).sum(axis=2)
+        total = share.sum(axis=1)
+        return np.where(total > 0, share[:, 0] / np.where(total > 0, total, 1), 0.5).tolist()
+
+    def batch_tables(self) -> BatchTables:
+        if self._batch_tables is None:
+            self._batch_tables = self._build_batch_tables()
+        return self._batch_tables
+
+    def _build_batch_tables(self) -> BatchTables:
+        present = np.zeros((SIDES, TEAM_SIZE), dtype=bool)
+        max_hp = np.ones((SIDES, TEAM_SIZE), dtype=np.int64)
+        stats = np.ones((SIDES, TEAM_SIZE, 5))
+        level = np.zeros((SIDES, TEAM_SIZE), dtype=np.int64)
+        types = np.zeros((SIDES, TEAM_SIZE, 2), dtype=np.int64)
+        tera_type = np.zeros((SIDES, TEAM_SIZE), dtype=np.int64)
+        sand_immune = np.zeros((SIDES, TEAM_SIZE), dtype=bool)
+        n_moves = np.ones((SIDES, TEAM_SIZE), dtype=np.int64)
+        moves = np.zeros((SIDES, TEAM_SIZE, 4, len(MoveData._fields)))
+        for side, team in enumerate(self.teams):
+            for index, mon in enumerate(team):
+                present[side, index] = True
+                max_hp[side, index] = mon.max_hp
+                stats[side, index] = mon.stats
+                level[side, index] = mon.level
+                types[side, index, : len(mon.types)] = mon.types[:2]
+                tera_type[side, index] = mon.tera_type
+                sand_immune[side, index] = bool(_SAND_IMMUNE.intersection(mon.types))
+                n_moves[side, index] = len(mon.moves)
+                for slot in range(4):
+                    moves[side, index, slot] = mon.moves[slot if slot < len(mon.moves) else 0]
+        weather = np.ones((len(Weather) + 1, len(PokemonType) + 1))
+        for (weather_value, move_type), multiplier in _WEATHER_BOOST.items():
+            weather[weather_value, move_type] = multiplier
+        terrain = np.ones((len(Field) + 1, len(PokemonType) + 1))
+        for terrain_value, move_type in _TERRAIN_BOOST.items():
+            terrain[terrain_value, move_type] = 1.3
+        terrain[_MISTY, _DRAGON] = 0.5
+        return BatchTables(
+            present,
+            max_hp,
+            stats,
+            level,
+            types,
+            tera_type,
+            sand_immune,
+            n_moves,
+            moves,
+            np.array(self.effectiveness),
+            weather,
+            terrain,
+        )
+
+    # HashedModel and FactoredModel
+
+    def state_key(self, state: BattleState) -> int:
+        key = 0
+        for side, team in enumerate(self.teams):
+            for index, mon in enumerate(team):
+                o = mon_offset(side, index)
+                key ^= ZOBRIST.mon(
+                    side,
+                    index,
+                    hp_bucket(state[o + HP] / mon.max_hp),
+                    state[o + STATUS],
+                    tuple(state[o + ATK : o + SPE + 1]),
+                    state[o + POSITION],
+                    state[o + TERA],
+                    state[o + POSITION] > 0 and state[o + TURNS_OUT] == 0,
+                    state[o + PROTECT_CHAIN],
+                )
+            tailwind = state[side_offset(side) + TAILWIND]
+            if tailwind:
+                key ^= ZOBRIST.side_condition[side][_TAILWIND]
+                key ^= ZOBRIST.turns(ZOBRIST.side_condition_turns[side], tailwind)
+        key ^= ZOBRIST.weather[state[WEATHER]]
+        if state[WEATHER]:
+            key ^= ZOBRIST.turns(ZOBRIST.weather_turns[state[WEATHER]], state[WEATHER_TURNS])
+        if state[TERRAIN]:
+            key ^= ZOBRIST.field[state[TERRAIN]]
+            key ^= ZOBRIST.turns(ZOBRIST.field_turns[state[TERRAIN]], state[TERRAIN_TURNS])
+        if state[TRICK_ROOM]:
+            key ^= ZOBRIST.field[_TRICK_ROOM]
+            key ^= ZOBRIST.turns(ZOBRIST.field_turns[_TRICK_ROOM], state[TRICK_ROOM])
+        return key
+
+    def observation_key(self) -> int:
+        """
+        Outcome key step() would have reported for reaching the battle this model was built from
+        """
+        return self.state_key(self.root)
+
+    def observation_keys(self) -> list[int]:
+        """
+        observation_key(), then the keys of the same battle with active mons' HP a bucket off
+        either way (never to or from fainted), fewest mons off first: the HP a turn of the
+        forward model leaves is an estimate, and often lands a bucket away from what was seen
+        """
+        state = self.root
+        choices = []
+        for side, team in enumerate(self.teams):
+            for slot in range(2):
+                index = state[side_offset(side) + ACTIVE + slot]
+                if index < 0:
+                    continue
+                bucket = hp_bucket(state[mon_offset(side, index) + HP] / team[index].max_hp)
+                keys = ZOBRIST.hp[side][index]
+                choices.append(
+                    [0] + [keys[bucket] ^ keys[other] for other in (bucket - 1, bucket + 1) if 1 <= other <= HP_BUCKETS]
+                    if bucket
+                    else [0]
+                )
+        key = self.state_key(state)
+        deltas = sorted(itertools.product(*choices), key=lambda delta: sum(map(bool, delta)))
+        return [functools.reduce(operator.xor, delta, key) for delta in deltas]
+
+    factor = staticmethod(factor)
+    join = staticmethod(join)
+    compatible = staticmethod(compatible)
+
+    # forward model
+
+    def alive(self, state: BattleState, side: int) -> int:
+        return sum(state[mon_offset(side, index) + HP] > 0 for index in range(len(self.teams[side])))
+
+    def hp_share(self, state: BattleState, side: int) -> float:
+        return sum(state[mon_offset(side, index) + HP] / mon.max_hp for index, mon in enumerate(self.teams[side]))
+
+    def slot_actions(self, state: BattleState, side: int, slot: int) -> list[int]:
+        """
+        Slot actions of the mon active in slot: every move (single target damaging moves at
+        each foe present, with and without tera while the side can tera) and every switch
+        """
+        s = side_offset(side)
+        index = state[s + ACTIVE + slot]
+        if index < 0:
+            return [0]
+        foes = [t + 1 for t in range(2) if state[side_offset(1 - side) + ACTIVE + t] >= 0]
+        can_tera = not state[s + TERA_USED]
+        actions = []
+        for move_index, move in enumerate(self.teams[side][index].moves):
+            single = move.spread == SINGLE and move.category != STATUS_MOVE
+            for target in foes if single and foes else (0,):
+                action = MOVE_ACTIONS + 5 * move_index + target + 2
+                actions.append(action)
+                if can_tera:
+                    actions.append(action + 4 * GIMMICK_ACTIONS)
+        for bench, _ in enumerate(self.teams[side]):
+            o = mon_offset(side, bench)
+            if state[o + HP] > 0 and state[o + POSITION] == 0:
+                actions.append(bench + 1)
+        return actions
+
+    def random_actions(self, state: BattleState, side: int) -> tuple[int, int]:
+        first = random.choice(self.slot_actions(state, side, 0))
+        seconds = [second for second in self.slot_actions(state, side, 1) if compatible(first, second)]
+        return first, random.choice(seconds) if seconds else 0
+
+    def switch(self, state: BattleState, side: int, slot: int, index: int):
+        s = side_offset(side)
+        o = mon_offset(side, index)
+        if index >= len(self.teams[side]) or state[o + HP] <= 0 or state[o + POSITION]:
+            return
+        out = state[s + ACTIVE + slot]
+        if out >= 0:
+            p = mon_offset(side, out)
+            for field in range(ATK, SPE + 1):
+                state[p + field] = 0
+            state[p + POSITION] = state[p + TURNS_OUT] = state[p + PROTECT_CHAIN] = 0
+        state[o + POSITION] = slot + 1
+        state[o + TURNS_OUT] = 0
+        state[s + ACTIVE + slot] = index
+
+    def speed(self, state: BattleState, side: int, index: int) -> float:
+        o = mon_offset(side, index)
+        speed = self.teams[side][index].stats[4] * _BOOST[state[o + SPE] + 6]
+        if state[side_offset(side) + TAILWIND]:
+            speed *= 2
+        if state[o + STATUS] == _PAR:
+            speed /= 2
+        return speed
+
+    def play_turn(self, state: BattleState, ours: tuple[int, int], theirs: tuple[int, int]):
+        movers = []
+        for side, actions in enumerate((ours, theirs)):
+            s = side_offset(side)
+            for slot, action in enumerate(actions):
+                index = state[s + ACTIVE + slot]
+                if index < 0 or action <= 0:
+                    continue
+                if action in SWITCHES:
+                    self.switch(state, side, slot, action - 1)
+                    continue
+                gimmick, rest = divmod(action - MOVE_ACTIONS, GIMMICK_ACTIONS)
+                moves = self.teams[side][index].moves
+                move = moves[rest // 5] if rest // 5 < len(moves) else moves[0]
+                if gimmick == 4 and not state[s + TERA_USED]:
+                    state[mon_offset(side, index) + TERA] = 1
+                    state[s + TERA_USED] = 1
+                movers.append((side, index, move, rest % 5 - 2))
+
+        trick_room = -1 if state[TRICK_ROOM] else 1
+        movers.sort(
+            key=lambda m: (m[2].priority, trick_room * self.speed(state, m[0], m[1]), random.random()),
+            reverse=True,
+        )
+        protected: set[int] = set()
+        flinched: set[int] = set()
+        for side, index, move, target in movers:
+            o = mon_offset(side, index)
+            if state[o + HP] <= 0 or not state[o + POSITION] or o in flinched or not self._can_act(state, o):
+                continue
+            if move.effect == PROTECT:
+                if random.random() * 3 ** state[o + PROTECT_CHAIN] < 1:
+                    protected.add(o)
+                    state[o + PROTECT_CHAIN] += 1
+                else:
+                    state[o + PROTECT_CHAIN] = 0
+                continue
+            state[o + PROTECT_CHAIN] = 0
+            if move.effect == TRICK_ROOM_MOVE:
+                state[TRICK_ROOM] = 0 if state[TRICK_ROOM] else 5
+            elif move.effect == TAILWIND_MOVE:
+                state[side_offset(side) + TAILWIND] = 4
+            if move.category == STATUS_MOVE or (move.effect == FAKE_OUT and state[o + TURNS_OUT]):
+                continue
+            targets = self._targets(state, side, index, move, target)
+            for target_side, target_index in targets:
+                d = mon_offset(target_side, target_index)
+                if d in protected or (move.accuracy < 1 and random.random() > move.accuracy):
+                    continue
+                damage = self.damage(state, side, index, target_side, target_index, move, len(targets) > 1)
+                state[d + HP] = max(0, state[d + HP] - damage)
+                if move.effect == FAKE_OUT:
+                    flinched.add(d)
+                if state[d + HP] == 0:
+                    self._faint(state, target_side, target_index)
+        self._end_turn(state)
+
+    def _can_act(self, state: BattleState, o: int) -> bool:
+        status = state[o + STATUS]
+        if status == _SLP or status == _FRZ:
+            # wake up or thaw with a flat chance instead of tracking counters
+            if random.random() < (1 / 3 if status == _SLP else 0.2):
+                state[o + STATUS] = 0
+                return True
+            return False
+        return status != _PAR or random.random() >= 0.25
+
+    def _targets(
+        self, state: BattleState, side: int, index: int, move: MoveData, target: int
+    ) -> list[tuple[int, int]]:
+        foe = 1 - side
+        foes = [(foe, i) for i in state[side_offset(foe) + ACTIVE : side_offset(foe) + ACTIVE + 2] if i >= 0]
+        if move.spread != SINGLE:
+            if move.spread == ADJACENT:
+                # position is the user's slot + 1, so its ally is in slot 2 - position
+                ally = state[side_offset(side) + ACTIVE + 2 - state[mon_offset(side, index) + POSITION]]
+                foes += [(side, ally)] if ally >= 0 else []
+            return foes
+        if target < 0:
+            ally = state[side_offset(side) + ACTIVE - target - 1]
+            return [(side, ally)] if ally >= 0 else []
+        if target > 0:
+            chosen = state[side_offset(foe) + ACTIVE + target - 1]
+            if chosen >= 0:
+                return [(foe, chosen)]
+        return foes[:1]
+
+    def damage(
+        self,
+        state: BattleState,
+        side: int,
+        index: int,
+        target_side: int,
+        target_index: int,
+        move: MoveData,
+        spread: bool,
+    ) -> int:
+        """
+        One random roll of move's damage. Everything but the roll is memoized per model,
+        keyed on the mons' positions (fixed within a model), the move and the state fields
+        the calc reads; a plain dict, as damage_cache.DamageCache's lock and LRU bookkeeping
+        cost more than the calc itself at this call rate
+        """
+        a, d = mon_offset(side, index), mon_offset(target_side, target_index)
+        if move.category == PHYSICAL:
+            attack, defense = state[a + ATK], state[d + DEF]
+            burned = state[a + STATUS] == _BRN
+        else:
+            attack, defense = state[a + SPA], state[d + SPD]
+            burned = False
+        # the model's MoveData live as long as it does, so their ids are stable
+        key = (a, d, id(move), spread, attack, defense, state[a + TERA], state[d + TERA], burned, state[WEATHER], state[TERRAIN])
+        base = self._damage_memo.get(key)
+        if base is None:
+            base = self._damage_base(state, side, index, target_side, target_index, move, spread)
+            if len(self._damage_memo) >= self.damage_memo_size:
+                self._damage_memo.clear()
+            self._damage_memo[key] = base
+        if not base:
+            return 0
+        # one of the 16 rolls from 85% to 100%, cheaper than random.randint
+        return max(1, int(base * (85 + int(random.random() * 16)) / 100))
+
+    def _damage_base(
+        self,
+        state: BattleState,
+        side: int,
+        index: int,
+        target_side: int,
+        target_index: int,
+        move: MoveData,
+        spread: bool,
+    ) -> float:
+        """
+        damage() before the random roll, 0 for no effect
+        """
+        attacker, defender = self.teams[side][index], self.teams[target_side][target_index]
+        a, d = mon_offset(side, index), mon_offset(target_side, target_index)
+        if move.category == PHYSICAL:
+            attack = attacker.stats[0] * _BOOST[state[a + ATK] + 6]
+            defense = defender.stats[1] * _BOOST[state[d + DEF] + 6]
+        else:
+            attack = attacker.stats[2] * _BOOST[state[a + SPA] + 6]
+            defense = defender.stats[3] * _BOOST[state[d + SPD] + 6]
+        effectiveness = self.effectiveness[move.type]
+        if state[d + TERA]:
+            multiplier = effectiveness[defender.tera_type]
+        else:
+            multiplier = 1.0
+            for t in defender.types:
+                multiplier *= effectiveness[t]
+        if multiplier == 0:
+            return 0.0
+        if state[a + TERA] and move.type == attacker.tera_type:
+            multiplier *= 2.0 if move.type in attacker.types else 1.5
+        elif move.type in attacker.types:
+            multiplier *= 1.5
+        if state[WEATHER]:
+            multiplier *= _WEATHER_BOOST.get((state[WEATHER], move.type), 1)
+        terrain = state[TERRAIN]
+        if terrain and _TERRAIN_BOOST.get(terrain) == move.type:
+            multiplier *= 1.3
+        elif terrain == _MISTY and move.type == _DRAGON:
+            multiplier *= 0.5
+        if spread:
+            multiplier *= 0.75
+        if move.category == PHYSICAL and state[a + STATUS] == _BRN:
+            multiplier *= 0.5
+        base = (2 * attacker.level // 5 + 2) * move.power * attack / defense / 50 + 2
+        return base * multiplier
+
+    def _faint(self, state: BattleState, side: int, index: int):
+        o = mon_offset(side, index)
+        s = side_offset(side)
+        if state[o + POSITION]:
+            state[s + ACTIVE + state[o + POSITION] - 1] = -1
+        state[o + POSITION] = 0
+        state[o + STATUS] = _FNT
+        for field in range(ATK, SPE + 1):
+            state[o + field] = 0
+
+    def _end_turn(self, state: BattleState):
+        weather, grassy = state[WEATHER], state[TERRAIN] == _GRASSY
+        for side, team in enumerate(self.teams):
+            s = side_offset(side)
+            for slot in range(2):
+                index = state[s + ACTIVE + slot]
+                if index < 0:
+                    continue
+                o = mon_offset(side, index)
+                mon = team[index]
+                status = state[o + STATUS]
+                chip = 0
+                if status == _BRN:
+                    chip += mon.max_hp // 16
+                elif status in _POISONED:
+                    chip += mon.max_hp // 8
+                if weather == _SAND and not _SAND_IMMUNE.intersection(mon.types):
+                    chip += mon.max_hp // 16
+                if grassy:
+                    chip -= mon.max_hp // 16
+                state[o + HP] = min(mon.max_hp, max(0, state[o + HP] - chip))
+                state[o + TURNS_OUT] += 1
+                if state[o + HP] == 0:
+                    self._faint(state, side, index)
+            if state[s + TAILWIND]:
+                state[s + TAILWIND] -= 1
+            for slot in range(2):
+                if state[s + ACTIVE + slot] < 0:
+                    for bench in range(len(team)):
+                        o = mon_offset(side, bench)
+                        if state[o + HP] > 0 and state[o + POSITION] == 0:
+                            self.switch(state, side, slot, bench)
+                            break
+        for field, turns in ((WEATHER, WEATHER_TURNS), (TERRAIN, TERRAIN_TURNS)):
+            if state[field] and state[turns]:
+                state[turns] -= 1
+                if not state[turns]:
+                    state[field] = 0
+        if state[TRICK_ROOM]:
+            state[TRICK_ROOM] -= 1
+        state[TURN] += 1
+
+    # batched forward model: the rollout policy of evaluate_many on (batch, STATE_SIZE) arrays
+    # updated in place. Movers and target positions are numbered side * 2 + slot; nobody
+    # switches before the end of the turn, so a position keeps its mon until then.
+
+    def _batch_turn(self, batch: np.ndarray, tables: BatchTables, rng: np.random.Generator):
+        size = len(batch)
+        rows = np.arange(size)
+        active = batch[:, _ACTIVE_COLUMNS].reshape(size, 4)
+        moving = active >= 0
+        sides = np.broadcast_to(_MOVER_SIDE, (size, 4))
+        indices = np.where(moving, active, 0)
+        offsets = (sides * TEAM_SIZE + indices) * MON_FIELDS
+        choice = (rng.random((size, 4)) * tables.n_moves[sides, indices]).astype(np.int64)
+        moves = tables.moves[sides, indices, choice]
+        targets = rng.integers(0, 2, (size, 4))
+
+        speed = tables.stats[sides, indices, 4] * _BOOST_ARRAY[batch[rows[:, None], offsets + SPE] + 6]
+        speed = np.where(batch[:, _TAILWIND_COLUMNS][:, _MOVER_SIDE] > 0, speed * 2, speed)
+        speed = np.where(batch[rows[:, None], offsets + STATUS] == _PAR, speed / 2, speed)
+        speed = np.where(batch[:, TRICK_ROOM, None] > 0, -speed, speed)
+        # priority brackets first, then speed, ties broken at random
+        order = np.argsort(-(moves[..., 3] * 1e6 + speed + rng.random((size, 4))), axis=1)
+
+        protected = np.zeros((size, 4), dtype=bool)
+        flinched = np.zeros((size, 4), dtype=bool)
+        for turn in range(4):
+            mover = order[:, turn]
+            side = _MOVER_SIDE[mover]
+            index = indices[rows, mover]
+            o = offsets[rows, mover]
+            move = moves[rows, mover]
+            effect, category = move[:, 6], move[:, 2]
+            acts = moving[rows, mover] & (batch[rows, o + HP] > 0) & (batch[rows, o + POSITION] > 0)
+            acts &= ~flinched[rows, mover] & self._batch_can_act(batch, o, acts, rng)
+
+            protecting = acts & (effect == PROTECT)
+            chain = batch[rows, o + PROTECT_CHAIN]
+            success = protecting & (rng.random(size) * 3.0**chain < 1)
+            protected[rows, mover] |= success
+            batch[rows, o + PROTECT_CHAIN] = np.where(success, chain + 1, np.where(acts, 0, chain))
+            trick_room = acts & (effect == TRICK_ROOM_MOVE)
+            batch[trick_room, TRICK_ROOM] = np.where(batch[trick_room, TRICK_ROOM] > 0, 0, 5)
+            tailwind = acts & (effect == TAILWIND_MOVE)
+            batch[rows[tailwind], _TAILWIND_COLUMNS[side[tailwind]]] = 4
+
+            attacks = acts & (category != STATUS_MOVE)
+            attacks &= ~((effect == FAKE_OUT) & (batch[rows, o + TURNS_OUT] > 0))
+            hit = self._batch_targets(batch, mover, move[:, 5], targets[rows, mover]) & attacks[:, None]
+            spread = hit.sum(axis=1) > 1
+            lands = hit & ~protected & (rng.random((size, 4)) <= move[:, 4, None])
+            r, position = np.nonzero(lands)
+            if not len(r):
+                continue
+            target_side = position // 2
+            target_index = batch[r, _ACTIVE_COLUMNS.reshape(4)[position]]
+            d = (target_side * TEAM_SIZE + target_index) * MON_FIELDS
+            damage = self._batch_damage(
+                batch, tables, rng, r, side[r], index[r], o[r], target_side, target_index, d, move[r], spread[r]
+            )
+            batch[r, d + HP] = np.maximum(0, batch[r, d + HP] - damage)
+            flinched[r, position] |= effect[r] == FAKE_OUT
+            fainted = batch[r, d + HP] == 0
+            self._batch_faint(batch, r[fainted], target_side[fainted], d[fainted])
+        self._batch_end_turn(batch, tables)
+
+    def _batch_can_act(self, batch: np.ndarray, o: np.ndarray, acts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        rows = np.arange(len(batch))
+        status = batch[rows, o + STATUS]
+        roll = rng.random(len(batch))
+        asleep = (status == _SLP) | (status == _FRZ)
+        wakes = asleep & (roll < np.where(status == _SLP, 1 / 3, 0.2))
+        batch[rows[wakes & acts], o[wakes & acts] + STATUS] = 0
+        return (~asleep | wakes) & ~((status == _PAR) & (roll < 0.25))
+
+    def _batch_targets(self, batch: np.ndarray, mover: np.ndarray, spread: np.ndarray, target: np.ndarray) -> np.ndarray:
+        """
+        (batch, 4) mask of the positions a move from mover hits, as _targets; single target
+        moves go to the chosen foe, or the other one if that slot is empty
+        """
+        size = len(batch)
+        rows = np.arange(size)
+        present = batch[:, _ACTIVE_COLUMNS].reshape(size, 4) >= 0
+        foe = (1 - _MOVER_SIDE[mover]) * 2
+        hit = np.zeros((size, 4), dtype=bool)
+        foe_present = np.stack([present[rows, foe], present[rows, foe + 1]], axis=1)
+        hit[rows, foe] = foe_present[:, 0] & (spread != SINGLE)
+        hit[rows, foe + 1] = foe_present[:, 1] & (spread != SINGLE)
+        hit[rows, mover ^ 1] = present[rows, mover ^ 1] & (spread == ADJACENT)
+        chosen = np.where(foe_present[rows, target], target, 1 - target)
+        single = (spread == SINGLE) & foe_present.any(axis=1)
+        hit[rows[single], foe[single] + chosen[single]] = True
+        return hit
+
+    def _batch_damage(
+        self,
+        batch: np.ndarray,
+        tables: BatchTables,
+        rng: np.random.Generator,
+        rows: np.ndarray,
+        side: np.ndarray,
+        index: np.ndarray,
+        a: np.ndarray,
+        target_side: np.ndarray,
+        target_index: np.ndarray,
+        d: np.ndarray,
+        move: np.ndarray,
+        spread: np.ndarray,
+    ) -> np.ndarray:
+        """
+        damage() for the attackers and targets of rows
+        """
+        power, move_type, category = move[:, 0], move[:, 1].astype(np.int64), move[:, 2]
+        physical = category == PHYSICAL
+        attacker, defender = tables.stats[side, index], tables.stats[target_side, target_index]
+        attack = np.where(
+            physical,
+            attacker[:, 0] * _BOOST_ARRAY[batch[rows, a + ATK] + 6],
+            attacker[:, 2] * _BOOST_ARRAY[batch[rows, a + SPA] + 6],
+        )
+        defense = np.where(
+            physical,
+            defender[:, 1] * _BOOST_ARRAY[batch[rows, d + DEF] + 6],
+            defender[:, 3] * _BOOST_ARRAY[batch[rows, d + SPD] + 6],
+        )
+        effectiveness = tables.effectiveness[move_type[:, None], tables.types[target_side, target_index]].prod(axis=1)
+        tera = tables.effectiveness[move_type, tables.tera_type[target_side, target_index]]
+        multiplier = np.where(batch[rows, d + TERA] > 0, tera, effectiveness)
+        stab = (tables.types[side, index] == move_type[:, None]).any(axis=1)
+        tera_stab = (batch[rows, a + TERA] > 0) & (tables.tera_type[side, index] == move_type)
+        multiplier *= np.where(tera_stab, np.where(stab, 2.0, 1.5), np.where(stab, 1.5, 1.0))
+        multiplier *= tables.weather[batch[rows, WEATHER], move_type]
+        multiplier *= tables.terrain[batch[rows, TERRAIN], move_type]
+        multiplier *= np.where(spread, 0.75, 1.0)
+        multiplier *= np.where(physical & (batch[rows, a + STATUS] == _BRN), 0.5, 1.0)
+        base = (2 * tables.level[side, index] // 5 + 2) * power * attack / defense / 50 + 2
+        damage = np.maximum(1, (base * multiplier * rng.integers(85, 101, len(rows)) / 100).astype(np.int64))
+        return np.where(multiplier > 0, damage, 0)
+
+    def _batch_faint(self, batch: np.ndarray, rows: np.ndarray, side: Union[int, np.ndarray], o: np.ndarray):
+        if not len(rows):
+            return
+        position = batch[rows, o + POSITION]
+        active = position > 0
+        side = np.broadcast_to(side, rows.shape)
+        batch[rows[active], _ACTIVE_COLUMNS[side[active], position[active] - 1]] = -1
+        batch[rows, o + POSITION] = 0
+        batch[rows, o + STATUS] = _FNT
+        for field in range(ATK, SPE + 1):
+            batch[rows, o + field] = 0
+
+    def _batch_end_turn(self, batch: np.ndarray, tables: BatchTables):
+        rows = np.arange(len(batch))
+        weather, grassy = batch[:, WEATHER], batch[:, TERRAIN] == _GRASSY
+        for side in range(SIDES):
+            for slot in range(2):
+                index = batch[:, _ACTIVE_COLUMNS[side, slot]]
+                r, index = rows[index >= 0], index[index >= 0]
+                o = (side * TEAM_SIZE + index) * MON_FIELDS
+                max_hp = tables.max_hp[side, index]
+                status = batch[r, o + STATUS]
+                chip = np.where(status == _BRN, max_hp // 16, 0)
+                chip += np.where(np.isin(status, _POISONED), max_hp // 8, 0)
+                chip += np.where((weather[r] == _SAND) & ~tables.sand_immune[side, index], max_hp // 16, 0)
+                chip -= np.where(grassy[r], max_hp // 16, 0)
+                batch[r, o + HP] = np.minimum(max_hp, np.maximum(0, batch[r, o + HP] - chip))
+                batch[r, o + TURNS_OUT] += 1
+                fainted = batch[r, o + HP] == 0
+                self._batch_faint(batch, r[fainted], side, o[fainted])
+            tailwind = batch[:, _TAILWIND_COLUMNS[side]]
+            batch[:, _TAILWIND_COLUMNS[side]] = np.maximum(0, tailwind - 1)
+            for slot in range(2):
+                bench = (batch[:, _MON_COLUMNS[HP, side]] > 0) & (batch[:, _MON_COLUMNS[POSITION, side]] == 0)
+                replace = (batch[:, _ACTIVE_COLUMNS[side, slot]] < 0) & bench.any(axis=1)
+                r = rows[replace]
+                index = bench[replace].argmax(axis=1)
+                o = (side * TEAM_SIZE + index) * MON_FIELDS
+                batch[r, o + POSITION] = slot + 1
+                batch[r, o + TURNS_OUT] = 0
+                batch[r, _ACTIVE_COLUMNS[side, slot]] = index
+        for field, turns in ((WEATHER, WEATHER_TURNS), (TERRAIN, TERRAIN_TURNS)):
+            counting = (batch[:, field] > 0) & (batch[:, turns] > 0)
+            batch[counting, turns] -= 1
+            batch[counting & (batch[:, turns] == 0), field] = 0
+        batch[:, TRICK_ROOM] = np.maximum(0, batch[:, TRICK_ROOM] - 1)
+        batch[:, TURN] += 1
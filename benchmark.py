@@ -0,0 +1,244 @@
+"""
+Throughput benchmark of the agents against the local Showdown server.
+
+Each agent plays itself over a fixed set of matchups: pairs of regh catalog teams drawn from
+a seeded RNG, every pair playing battles_per_pair battles with its two teams. A run reports
+battles/s and turns/s, latency percentiles of every choose_move, peak RSS and CPU seconds per
+battle, written as JSON and compared against a stored baseline. Each agent runs in a fresh
+process of its own, so its peak RSS is not one an agent benchmarked before it reached, e.g.
+
+    python benchmark.py first,mcts 40 benchmark_results.json benchmark_baseline.json
+
+exits with 1 if any metric regressed by more than TOLERANCE. The server's own RNG is not
+seeded, so battles still differ from run to run; the matchups and the agents' RNG do not.
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+from poke_env.player import Player
+from poke_env.ps_client import LocalhostServerConfiguration, ServerConfiguration
+
+from mctsAgent import mctsAgent
+from pythonTest import YourFirstAgent
+from selfplay import PlayerFactory, SelfPlayRunner
+from teams import RandomTeamBuilder, team_count
+
+BATTLE_FORMAT = "gen9vgc2025regh"
+SEED = 2025
+TOLERANCE = 0.1
+
+AGENTS: dict[str, PlayerFactory] = {
+    "first": YourFirstAgent,
+    # a fixed simulation count, so that results do not depend on the turn timer
+    "mcts": functools.partial(mctsAgent, simulations=256),
+}
+
+# metric -> whether higher is better
+METRICS = {
+    "battles_per_second": True,
+    "turns_per_second": True,
+    "latency_p50_ms": False,
+    "latency_p95_ms": False,
+    "latency_p99_ms": False,
+    "peak_rss_mb": False,
+    "cpu_seconds_per_battle": False,
+}
+
+
+class BenchmarkResult(NamedTuple):
+    agent: str
+    battles: int
+    turns: int
+    decisions: int
+    seconds: float
+    battles_per_second: float
+    turns_per_second: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    peak_rss_mb: float
+    cpu_seconds_per_battle: float
+
+
+def matchups(count: int, seed: int = SEED, battle_format: str = BATTLE_FORMAT) -> list[tuple[int, int]]:
+    """
+    count pairs of distinct catalog team indices of battle_format, the same for a given seed
+    """
+    rng = random.Random(seed)
+    return [tuple(rng.sample(range(team_count(battle_format)), 2)) for _ in range(count)]
+
+
+def _cpu_seconds() -> float:
+    # search workers are child processes
+    return sum(
+        usage.ru_utime + usage.ru_stime
+        for usage in (resource.getrusage(resource.RUSAGE_SELF), resource.getrusage(resource.RUSAGE_CHILDREN))
+    )
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux; the peak of the process so far, hence run_isolated
+    return max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    ) / 1024
+
+
+class BenchmarkRunner(SelfPlayRunner):
+    def __init__(self, player_factory: PlayerFactory, teams: list[tuple[int, int]], **kwargs):
+        """
+        SelfPlayRunner with one pair per matchup in teams, whose players bring those teams
+        and time every choose_move into latencies
+        """
+        super().__init__(player_factory, pairs=len(teams), **kwargs)
+        self.teams = teams
+        self.latencies: list[float] = []
+
+    def player_options(self, pair: int, side: int) -> dict:
+        return {"team": RandomTeamBuilder([self.teams[pair][side]], self.battle_format)}
+
+    def make_pair(self, pair: int) -> tuple[Player, Player]:
+        players = super().make_pair(pair)
+        for player in players:
+            self._time_decisions(player)
+        return players
+
+    def _time_decisions(self, player: Player):
+        choose = player.choose_move
+
+        async def finish(start: float, choice):
+            order = await choice
+            self.latencies.append(time.perf_counter() - start)
+            return order
+
+        def choose_move(battle):
+            start = time.perf_counter()
+            choice = choose(battle)
+            if inspect.isawaitable(choice):
+                return finish(start, choice)
+            self.latencies.append(time.perf_counter() - start)
+            return choice
+
+        player.choose_move = choose_move
+
+
+async def run_benchmark(
+    agent: str,
+    battles: int,
+    seed: int = SEED,
+    battles_per_pair: int = 5,
+    max_concurrent_battles: int = 4,
+    server_configuration: ServerConfiguration = LocalhostServerConfiguration,
+) -> BenchmarkResult:
+    """
+    agent (a key of AGENTS) against itself for about battles battles, rounded up to whole
+    matchups of battles_per_pair
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    runner = BenchmarkRunner(
+        AGENTS[agent],
+        matchups(-(-battles // battles_per_pair), seed),
+        battle_format=BATTLE_FORMAT,
+        battles_per_pair=battles_per_pair,
+        max_concurrent_battles=max_concurrent_battles,
+        server_configuration=server_configuration,
+        name_prefix=f"bench{agent}",
+    )
+    cpu = _cpu_seconds()
+    report = await runner.run()
+    cpu = _cpu_seconds() - cpu
+    turns = sum(result.turns for result in report.results)
+    p50, p95, p99 = np.percentile(runner.latencies, [50, 95, 99]) * 1000 if runner.latencies else (0.0, 0.0, 0.0)
+    return BenchmarkResult(
+        agent,
+        report.battles,
+        turns,
+        len(runner.latencies),
+        report.seconds,
+        report.battles_per_second,
+        turns / report.seconds if report.seconds else 0.0,
+        float(p50),
+        float(p95),
+        float(p99),
+        _peak_rss_mb(),
+        cpu / report.battles if report.battles else 0.0,
+    )
+
+
+def _run_benchmark_sync(agent: str, battles: int) -> BenchmarkResult:
+    return asyncio.run(run_benchmark(agent, battles))
+
+
+def run_isolated(agent: str, battles: int) -> BenchmarkResult:
+    """
+    run_benchmark in a newly spawned process, whose peak RSS is this agent's alone: the
+    child starts from this process's own peak (exec keeps ru_maxrss), and this process only
+    waits, so every agent starts from the same imports
+    """
+    with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(_run_benchmark_sync, agent, battles).result()
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float = TOLERANCE) -> list[str]:
+    """
+    The metrics of results worse than baseline's by more than tolerance, as readable lines;
+    agents missing from either side are skipped
+    """
+    regressions = []
+    for agent, result in results.items():
+        if agent not in baseline:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            new, old = result[metric], baseline[agent][metric]
+            if not old:
+                continue
+            change = (new - old) / old
+            if (change < -tolerance) if higher_is_better else (change > tolerance):
+                regressions.append(f"{agent} {metric}: {old:.4g} -> {new:.4g} ({change:+.1%})")
+    return regressions
+
+
+def main(agents: list[str], battles: int, results_path: str, baseline_path: str) -> int:
+    results = {}
+    for agent in agents:
+        result = run_isolated(agent, battles)
+        results[agent] = result._asdict()
+        print(
+            f"{agent}: {result.battles_per_second:.2f} battles/s, {result.turns_per_second:.1f} turns/s, "
+            f"decision p50/p95/p99 {result.latency_p50_ms:.1f}/{result.latency_p95_ms:.1f}/"
+            f"{result.latency_p99_ms:.1f} ms, peak RSS {result.peak_rss_mb:.0f} MB, "
+            f"{result.cpu_seconds_per_battle:.2f} CPU s/battle"
+        )
+    with open(results_path, "w") as f:
+        json.dump({"battle_format": BATTLE_FORMAT, "seed": SEED, "results": results}, f, indent=2)
+
+    if not os.path.exists(baseline_path):
+        print(f"no baseline at {baseline_path}; copy {results_path} there to start one")
+        return 0
+    with open(baseline_path) as f:
+        regressions = compare(results, json.load(f)["results"])
+    for regression in regressions:
+        print("regression:", regression)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    # python benchmark.py [agents, comma separated] [battles per agent] [results file] [baseline file]
+    args = sys.argv[1:5]
+    agents, battles, results_path, baseline_path = (
+        *args,
+        *(",".join(AGENTS), "40", "benchmark_results.json", "benchmark_baseline.json")[len(args) :],
+    )
+    sys.exit(main(agents.split(","), int(battles), results_path, baseline_path))
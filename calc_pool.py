@@ -0,0 +1,169 @@
+"""
+Pool of long-lived node processes answering @smogon/calc queries, for the calcs that need
+its full fidelity (team preview, endgames) rather than damage_calc's approximation.
+
+Every worker runs smogon_calc.js and answers line-delimited JSON batches in order, so
+requests are pipelined: submit() writes a batch to the least loaded worker and returns a
+future straight away, and a reader thread per worker resolves the futures of its batches
+as the answers come back. Node starts once per worker instead of once per calc, and
+repeated queries are answered from a damage_cache.DamageCache keyed on the query's
+canonical JSON without reaching node at all. calc() asks by set instead, e.g. as the
+backend of a DamageCache keyed on canonical calc tuples.
+
+Queries are the dicts damage_calc.smogon_query builds; results are 16 rolls, lowest first.
+"""
+
+import asyncio
+import json
+import os
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional, Sequence
+
+from damage_cache import DamageCache
+from damage_calc import NEUTRAL, SMOGON_CALC_PATH, CalcMove, CalcSet, Conditions, smogon_query
+
+
+class CalcWorker:
+    """
+    One node process; batches are answered in the order they were written
+    """
+
+    def __init__(self, script: str = SMOGON_CALC_PATH):
+        self.process = subprocess.Popen(
+            ["node", script],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            cwd=os.path.dirname(script),
+        )
+        self.pending: deque[tuple[Future, int]] = deque()
+        self.queued = 0
+        self._lock = threading.Lock()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._reader.start()
+
+    def submit(self, queries: Sequence[dict]) -> Future:
+        future: Future = Future()
+        line = json.dumps(list(queries), separators=(",", ":")) + "\n"
+        with self._lock:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"calc worker exited with {self.process.returncode}")
+            self.pending.append((future, len(queries)))
+            self.queued += len(queries)
+            self.process.stdin.write(line)
+            self.process.stdin.flush()
+        return future
+
+    def _read(self):
+        for line in self.process.stdout:
+            with self._lock:
+                future, count = self.pending.popleft()
+                self.queued -= count
+            future.set_result(json.loads(line))
+        with self._lock:
+            pending, self.pending = self.pending, deque()
+            self.queued = 0
+        for future, _ in pending:
+            future.set_exception(RuntimeError("calc worker exited"))
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+        self._reader.join()
+
+
+class CalcPool:
+    def __init__(
+        self, workers: int = 2, batch_size: int = 256, cache_size: int = 1 << 16, script: str = SMOGON_CALC_PATH
+    ):
+        """
+        batch_size caps the queries per line sent to a worker, so large requests are spread
+        over the workers and pipelined; cache_size bounds the LRU of answered queries
+        """
+        assert workers > 0 and batch_size > 0
+        self.workers = [CalcWorker(script) for _ in range(workers)]
+        self.batch_size = batch_size
+        self.cache = DamageCache(maxsize=cache_size)
+
+    def __enter__(self) -> "CalcPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+
+    @staticmethod
+    def key(query: dict) -> str:
+        return json.dumps(query, sort_keys=True, separators=(",", ":"))
+
+    def submit(self, queries: Sequence[dict]) -> Future:
+        """
+        Future of the rolls of every query (None for queries @smogon/calc rejected), without
+        waiting for node: cached and repeated queries are answered once, the rest are split
+        into batches over the least loaded workers
+        """
+        keys = [self.key(query) for query in queries]
+        results: list[Optional[list[int]]] = [self.cache.get(key) for key in keys]
+        missing: dict[str, list[int]] = {}
+        for i, rolls in enumerate(results):
+            if rolls is None:
+                missing.setdefault(keys[i], []).append(i)
+        done: Future = Future()
+        if not missing:
+            done.set_result(results)
+            return done
+
+        unique = list(missing)
+        batches = []
+        for start in range(0, len(unique), self.batch_size):
+            batch = unique[start : start + self.batch_size]
+            worker = min(self.workers, key=lambda w: w.queued)
+            batches.append((batch, worker.submit([queries[missing[key][0]] for key in batch])))
+        remaining = len(batches)
+        lock = threading.Lock()
+
+        def collect(batch: list[str], future: Future):
+            nonlocal remaining
+            error = future.exception()
+            if error is None:
+                for key, rolls in zip(batch, future.result()):
+                    self.cache.put(key, rolls)
+                    for i in missing[key]:
+                        results[i] = rolls
+            with lock:
+                remaining -= 1
+                if done.done():
+                    return
+                if error is not None:
+                    done.set_exception(error)
+                elif not remaining:
+                    done.set_result(results)
+
+        for batch, future in batches:
+            future.add_done_callback(lambda future, batch=batch: collect(batch, future))
+        return done
+
+    def rolls_many(self, queries: Sequence[dict]) -> list[Optional[list[int]]]:
+        return self.submit(queries).result()
+
+    def rolls(self, query: dict) -> Optional[list[int]]:
+        return self.rolls_many([query])[0]
+
+    def calc(
+        self, attacker: CalcSet, move: CalcMove, defender: CalcSet, conditions: Conditions = NEUTRAL
+    ) -> Optional[list[int]]:
+        return self.rolls(smogon_query(attacker, move, defender, conditions))
+
+    async def rolls_async(self, queries: Sequence[dict]) -> list[Optional[list[int]]]:
+        """
+        rolls_many without blocking the event loop, e.g. from a team preview handler
+        """
+        return await asyncio.wrap_future(self.submit(queries))
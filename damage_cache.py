@@ -0,0 +1,98 @@
+"""
+Bounded LRU memo of damage rolls, in front of either damage path (damage_calc.DamageTables
+or calc_pool.CalcPool).
+
+Calcs are keyed on a compact canonical tuple rather than on the sets themselves: per mon
+what its stats and modifiers come from (species, level, nature, EVs, IVs, item, ability,
+tera type), the move's name and the Conditions, with the flags the move cannot be affected
+by reset so that e.g. a special move hits the same entry whether or not its user is burned.
+The same calc recurs all through a search and from one battle to the next, so repeats cost
+a dict lookup. The search's own forward model (battle_model.DoublesModel.damage) memoizes
+its calcs the same way, on a lock-free per-model dict keyed on state fields instead.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+from damage_calc import NEUTRAL, PHYSICAL, CalcMove, CalcSet, Conditions
+
+DamageBackend = Callable[[CalcSet, CalcMove, CalcSet, Conditions], Optional[list[int]]]
+
+
+def set_key(mon: CalcSet) -> tuple:
+    return (mon.name, mon.level, mon.nature, mon.evs, mon.ivs, mon.item, mon.ability, mon.tera_type)
+
+
+def calc_key(attacker: CalcSet, move: CalcMove, defender: CalcSet, conditions: Conditions = NEUTRAL) -> tuple:
+    c = conditions
+    if not move.spread and not c.spread:
+        c = c._replace(spread=True)
+    if c.burned and move.category != PHYSICAL:
+        c = c._replace(burned=False)
+    if c.attacker_tera and not attacker.tera_type:
+        c = c._replace(attacker_tera=False)
+    if c.defender_tera and not defender.tera_type:
+        c = c._replace(defender_tera=False)
+    return set_key(attacker), move.name, set_key(defender), c
+
+
+class DamageCache:
+    def __init__(self, backend: Optional[DamageBackend] = None, maxsize: int = 1 << 16):
+        """
+        backend computes the calcs rolls() misses; maxsize 0 disables caching
+        """
+        self.backend = backend
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, list[int]] = OrderedDict()
+        # the calc pool stores answers from its reader threads
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get(self, key: Hashable) -> Optional[list[int]]:
+        with self._lock:
+            rolls = self._entries.get(key)
+            if rolls is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return rolls
+
+    def put(self, key: Hashable, rolls: Optional[list[int]]):
+        if rolls is None or not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = rolls
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def rolls(
+        self, attacker: CalcSet, move: CalcMove, defender: CalcSet, conditions: Conditions = NEUTRAL
+    ) -> Optional[list[int]]:
+        """
+        The backend's rolls for this calc, computed at most once while it stays cached
+        """
+        key = calc_key(attacker, move, defender, conditions)
+        rolls = self.get(key)
+        if rolls is None:
+            rolls = self.backend(attacker, move, defender, conditions)
+            self.put(key, rolls)
+        return rolls
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
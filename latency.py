@@ -0,0 +1,193 @@
+"""
+Latency histograms of the callbacks a Player spends the turn timer in.
+
+@instrumented on a Player subclass times every choose_move, teampreview and battle message
+it handles into a LatencyRecorder, one histogram per battle format and phase:
+
+    choose_move   a move request, up to the order being ready (async searches included)
+    force_switch  a choose_move that only picks replacements for fainted mons
+    teampreview   picking the team order
+    message       handling one batch of battle messages, requests answered in it included
+
+It is off unless the AGENT_LATENCY environment variable names the file to export to when
+the class is defined; while off, @instrumented returns the class itself, so an agent that is
+not measured runs exactly the code it would without the decorator. Files ending in .prom
+are rewritten in the Prometheus text format (for node_exporter's textfile collector); any
+other path gets one JSON line per histogram appended. The recorder exports after every
+finished battle.
+"""
+
+import bisect
+import json
+import os
+import time
+from typing import Awaitable, Optional, TypeVar
+
+from poke_env.battle import AbstractBattle
+from poke_env.player import Player
+
+LATENCY_ENV = "AGENT_LATENCY"
+# seconds; Showdown's turn timer allows well under a minute per turn
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+P = TypeVar("P", bound=type[Player])
+
+
+class LatencyHistogram:
+    def __init__(self, buckets: tuple[float, ...] = BUCKETS):
+        self.buckets = buckets
+        # the last count is for latencies above every bucket
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q quantile (max above the last bucket)
+        """
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.max
+
+
+class LatencyRecorder:
+    def __init__(self, path: Optional[str] = None, buckets: tuple[float, ...] = BUCKETS):
+        """
+        path is where export() writes: the Prometheus text format for .prom, JSON lines
+        otherwise
+        """
+        self.path = path
+        self.buckets = buckets
+        self.histograms: dict[tuple[str, str], LatencyHistogram] = {}
+
+    def observe(self, battle_format: str, phase: str, seconds: float):
+        histogram = self.histograms.get((battle_format, phase))
+        if histogram is None:
+            histogram = self.histograms[(battle_format, phase)] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+    def prometheus(self) -> str:
+        lines = [
+            "# HELP agent_decision_seconds Time agents spend in Showdown callbacks",
+            "# TYPE agent_decision_seconds histogram",
+        ]
+        for (battle_format, phase), histogram in sorted(self.histograms.items()):
+            labels = f'format="{battle_format}",phase="{phase}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'agent_decision_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'agent_decision_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"agent_decision_seconds_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"agent_decision_seconds_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def jsonl(self) -> str:
+        now = time.time()
+        return "".join(
+            json.dumps(
+                {
+                    "time": now,
+                    "format": battle_format,
+                    "phase": phase,
+                    "count": histogram.count,
+                    "sum": histogram.sum,
+                    "max": histogram.max,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                    "p99": histogram.quantile(0.99),
+                    "buckets": list(histogram.buckets),
+                    "counts": histogram.counts,
+                }
+            )
+            + "\n"
+            for (battle_format, phase), histogram in sorted(self.histograms.items())
+        )
+
+    def export(self, path: Optional[str] = None):
+        path = path or self.path
+        if path is None:
+            return
+        if path.endswith(".prom"):
+            # the collector may read at any time, so the file is replaced whole
+            with open(path + ".tmp", "w") as f:
+                f.write(self.prometheus())
+            os.replace(path + ".tmp", path)
+        else:
+            with open(path, "a") as f:
+                f.write(self.jsonl())
+
+
+def _configured_recorder() -> Optional[LatencyRecorder]:
+    path = os.environ.get(LATENCY_ENV)
+    return LatencyRecorder(path) if path else None
+
+
+LATENCY = _configured_recorder()
+
+
+def _battle_format(battle_tag: str) -> str:
+    # battle-gen9vgc2025regh-12345, with a leading > on raw messages
+    parts = battle_tag.split("-")
+    return parts[1] if len(parts) > 2 else "unknown"
+
+
+def _format_of(battle: AbstractBattle) -> str:
+    return battle.format or _battle_format(battle.battle_tag)
+
+
+def instrumented(cls: P, recorder: Optional[LatencyRecorder] = LATENCY) -> P:
+    """
+    Subclass of cls timing its callbacks into recorder, or cls itself when recorder is None
+    """
+    if recorder is None:
+        return cls
+
+    class Instrumented(cls):
+        def choose_move(self, battle: AbstractBattle):
+            start = time.perf_counter()
+            # a list per slot in doubles
+            forced = battle.force_switch
+            phase = "force_switch" if (any(forced) if isinstance(forced, list) else forced) else "choose_move"
+            choice = super().choose_move(battle)
+            if isinstance(choice, Awaitable):
+                return self._timed_choice(choice, _format_of(battle), phase, start)
+            recorder.observe(_format_of(battle), phase, time.perf_counter() - start)
+            return choice
+
+        async def _timed_choice(self, choice: Awaitable, battle_format: str, phase: str, start: float):
+            order = await choice
+            recorder.observe(battle_format, phase, time.perf_counter() - start)
+            return order
+
+        def teampreview(self, battle: AbstractBattle) -> str:
+            start = time.perf_counter()
+            order = super().teampreview(battle)
+            recorder.observe(_format_of(battle), "teampreview", time.perf_counter() - start)
+            return order
+
+        async def _handle_battle_message(self, split_messages: list[list[str]]):
+            start = time.perf_counter()
+            await super()._handle_battle_message(split_messages)
+            recorder.observe(_battle_format(split_messages[0][0]), "message", time.perf_counter() - start)
+
+        def _battle_finished_callback(self, battle: AbstractBattle):
+            super()._battle_finished_callback(battle)
+            recorder.export()
+
+    Instrumented.__name__ = Instrumented.__qualname__ = cls.__name__
+    Instrumented.__module__ = cls.__module__
+    Instrumented.__doc__ = cls.__doc__
+    return Instrumented
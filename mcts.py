@@ -0,0 +1,955 @@
+"""
+Monte Carlo Tree Search with the tree stored as a structure of preallocated NumPy arrays.
+
+The tree alternates decision nodes, whose children are our actions and are allocated as one
+contiguous block so PUCT runs on array slices, and action nodes, whose children are the
+outcomes the model reported for that action (opponent choices, damage rolls, ...) kept in
+a sibling list keyed by the model's outcome key. Values are always from our point of view.
+
+FactoredMCTS splits each decision node's joint action into one bandit per slot (decoupled
+UCT): the contiguous children of a decision node are then per-slot arms, and the joint
+actions actually tried hang off it in a second sibling list that grows by progressive
+widening, so a doubles turn costs about |slot 1| + |slot 2| arms rather than their product.
+
+Given a TranspositionTable, leaf values are shared between equal states reached along
+different paths, keyed by the model's state hash. Models with make/unmake can be searched
+in place, on one state object instead of a copy per step, and models that value many states
+at once more cheaply than one by one get the leaves of batched search together.
+"""
+
+import asyncio
+import math
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Awaitable, Callable, Optional, Protocol, Sequence, Union
+
+import numpy as np
+
+NO_NODE = -1
+ROOT = 0
+
+_KEY_MASK = (1 << 64) - 1
+
+RootStatistics = tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class SearchModel(Protocol):
+    def legal_actions(self, state: Any) -> Sequence[int]:
+        """
+        Our legal action ids in state
+        """
+
+    def priors(self, state: Any, actions: Sequence[int]) -> Optional[Sequence[float]]:
+        """
+        Prior probability of each action, None for uniform
+        """
+
+    def step(self, state: Any, action: int) -> tuple[Any, int]:
+        """
+        Plays our action (the model picks the opponent's) and returns the next state with an
+        integer key identifying the outcome
+        """
+
+    def terminal_value(self, state: Any) -> Optional[float]:
+        """
+        Value in [0, 1] if state ends the search, else None
+        """
+
+    def evaluate(self, state: Any) -> float:
+        """
+        Estimated value in [0, 1] of a non-terminal state, e.g. from a rollout
+        """
+
+
+class FactoredModel(SearchModel, Protocol):
+    def factor(self, action: int) -> tuple[int, int]:
+        """
+        Per-slot action ids of a joint action id
+        """
+
+    def join(self, first: int, second: int) -> int:
+        """
+        Joint action id of two slot action ids
+        """
+
+    def compatible(self, first: int, second: int) -> bool:
+        """
+        Whether the two slot actions may be chosen together (e.g. not both terastallizing)
+        """
+
+
+class InPlaceModel(SearchModel, Protocol):
+    def make(self, state: Any, action: int) -> tuple[Any, Any]:
+        """
+        step() applied to state itself: returns the outcome key and a token for unmake
+        """
+
+    def unmake(self, state: Any, undo: Any):
+        """
+        Reverts the make() that returned undo; makes are unmade in reverse order
+        """
+
+    def snapshot(self, state: Any) -> Any:
+        """
+        Independent copy of state
+        """
+
+
+class BatchedModel(SearchModel, Protocol):
+    def evaluate_many(self, states: Sequence[Any]) -> Sequence[float]:
+        """
+        evaluate() of every state, done together (e.g. vectorized) for less than the sum
+        """
+
+
+class HashedModel(SearchModel, Protocol):
+    def state_key(self, state: Any) -> int:
+        """
+        Hash of state that equal states share whichever way they were reached, e.g. a
+        Zobrist hash
+        """
+
+
+class TranspositionTable:
+    """
+    Fixed size table of leaf statistics (evaluations, value sum) per state hash, so states
+    reached along different paths share their evaluations. Slots come in buckets of ways
+    picked by the low bits of the hash; a new state takes an empty slot of its bucket, else
+    the slot of the state least recently used by a search generation, fewest evaluations
+    first. A state is evaluated until it has samples evaluations, each giving the search
+    the mean of all of them so far, and from then on that mean is reused: one random rollout
+    is too noisy to stand for a state for the rest of the battle.
+    """
+
+    def __init__(self, slots: int = 1 << 16, ways: int = 4, samples: int = 4):
+        assert slots & (slots - 1) == 0 and ways & (ways - 1) == 0 and slots >= ways
+        self.ways = ways
+        self.samples = samples
+        self._bucket_mask = (slots - 1) & ~(ways - 1)
+        self.keys = np.zeros(slots, dtype=np.uint64)
+        self.visits = np.zeros(slots, dtype=np.int32)
+        self.value_sum = np.zeros(slots, dtype=np.float64)
+        self.generation = np.zeros(slots, dtype=np.uint32)
+        self.current = 1
+        self.hits = 0
+        self.misses = 0
+        self.replacements = 0
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.visits))
+
+    def new_generation(self):
+        """
+        Marks the start of a new search (e.g. a new turn); entries not used since age out first
+        """
+        self.current += 1
+
+    def clear(self):
+        self.visits[:] = 0
+        self.value_sum[:] = 0
+        self.generation[:] = 0
+
+    def _find(self, key: int) -> int:
+        start = key & self._bucket_mask
+        for slot in range(start, start + self.ways):
+            if self.visits[slot] and self.keys[slot] == key:
+                return slot
+        return NO_NODE
+
+    def value(self, key: int) -> Optional[float]:
+        """
+        Mean value of state key if it has been evaluated samples times, else None
+        """
+        key &= _KEY_MASK
+        slot = self._find(key)
+        if slot == NO_NODE or self.visits[slot] < self.samples:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.generation[slot] = self.current
+        return float(self.value_sum[slot]) / int(self.visits[slot])
+
+    def store(self, key: int, value: float) -> float:
+        """
+        Adds one evaluation of state key and returns its mean over the evaluations stored
+        """
+        key &= _KEY_MASK
+        slot = self._find(key)
+        if slot == NO_NODE:
+            start = key & self._bucket_mask
+            slot = min(
+                range(start, start + self.ways),
+                key=lambda s: (self.visits[s] > 0, self.generation[s] == self.current, self.visits[s]),
+            )
+            if self.visits[slot]:
+                self.replacements += 1
+            self.keys[slot] = key
+            self.visits[slot] = 0
+            self.value_sum[slot] = 0
+        self.visits[slot] += 1
+        self.value_sum[slot] += value
+        self.generation[slot] = self.current
+        return float(self.value_sum[slot]) / int(self.visits[slot])
+
+
+class Tree:
+    """
+    Node storage; a node is an index into the arrays below
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        self.capacity = 0
+        self.size = 0
+        self.visits = np.zeros(0, dtype=np.int32)
+        self.value_sum = np.zeros(0, dtype=np.float64)
+        self.prior = np.zeros(0, dtype=np.float64)
+        # action id for children of decision nodes, outcome key for children of action nodes
+        self.key = np.zeros(0, dtype=np.int64)
+        self.parent = np.zeros(0, dtype=np.int32)
+        self.first_child = np.zeros(0, dtype=np.int32)
+        self.n_children = np.zeros(0, dtype=np.int32)
+        self.next_sibling = np.zeros(0, dtype=np.int32)
+        # factored decision nodes only: head of the joint action list, number of slot 1 arms
+        self.first_joint = np.zeros(0, dtype=np.int32)
+        self.split = np.zeros(0, dtype=np.int32)
+        self._grow(capacity)
+        self.reset()
+
+    _ARRAYS = (
+        "visits",
+        "value_sum",
+        "prior",
+        "key",
+        "parent",
+        "first_child",
+        "n_children",
+        "next_sibling",
+        "first_joint",
+        "split",
+    )
+    _POINTERS = ("parent", "first_child", "next_sibling", "first_joint")
+
+    def _grow(self, capacity: int):
+        for name in self._ARRAYS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+        self.capacity = capacity
+
+    def reset(self):
+        self.size = 0
+        self.allocate(1, parent=NO_NODE)
+
+    def allocate(self, count: int, parent: int) -> int:
+        """
+        Allocates count contiguous fresh nodes under parent and returns the first index
+        """
+        if self.size + count > self.capacity:
+            self._grow(max(2 * self.capacity, self.size + count))
+        start, end = self.size, self.size + count
+        self.visits[start:end] = 0
+        self.value_sum[start:end] = 0
+        self.prior[start:end] = 0
+        self.key[start:end] = 0
+        self.parent[start:end] = parent
+        self.first_child[start:end] = NO_NODE
+        self.n_children[start:end] = 0
+        self.next_sibling[start:end] = NO_NODE
+        self.first_joint[start:end] = NO_NODE
+        self.split[start:end] = 0
+        self.size = end
+        return start
+
+    def children(self, node: int) -> range:
+        """
+        Children of a decision node
+        """
+        start = self.first_child[node]
+        return range(start, start + self.n_children[node]) if start != NO_NODE else range(0)
+
+    def find_outcome(self, node: int, key: int) -> int:
+        child = self.first_child[node]
+        while child != NO_NODE:
+            if self.key[child] == key:
+                return child
+            child = self.next_sibling[child]
+        return NO_NODE
+
+    def find_joint(self, node: int, key: int) -> int:
+        child = self.first_joint[node]
+        while child != NO_NODE:
+            if self.key[child] == key:
+                return child
+            child = self.next_sibling[child]
+        return NO_NODE
+
+    def joints(self, node: int) -> list[int]:
+        """
+        Joint action children of a factored decision node
+        """
+        joints = []
+        child = int(self.first_joint[node])
+        while child != NO_NODE:
+            joints.append(child)
+            child = int(self.next_sibling[child])
+        return joints
+
+    def outcome_child(self, node: int, key: int) -> int:
+        """
+        Child of action node for outcome key, created if it was never seen
+        """
+        child = self.find_outcome(node, key)
+        if child != NO_NODE:
+            return child
+        child = self.allocate(1, parent=node)
+        self.key[child] = key
+        self.next_sibling[child] = self.first_child[node]
+        self.first_child[node] = child
+        self.n_children[node] += 1
+        return child
+
+    def reroot(self, root: int) -> int:
+        """
+        Makes decision node root the new root, moving its subtree to the front of the arrays
+        so the space of every other node is reclaimed; returns the number of nodes kept
+        """
+        # breadth first, appending all children of a node at once, keeps every decision
+        # node's children contiguous in the new layout
+        order = [root]
+        decision = [True]
+        i = 0
+        while i < len(order):
+            node = order[i]
+            first = int(self.first_child[node])
+            if decision[i]:
+                if first != NO_NODE:
+                    order.extend(range(first, first + int(self.n_children[node])))
+                    decision.extend([False] * int(self.n_children[node]))
+                joints = self.joints(node)
+                order.extend(joints)
+                decision.extend([False] * len(joints))
+            else:
+                child = first
+                while child != NO_NODE:
+                    order.append(child)
+                    decision.append(True)
+                    child = int(self.next_sibling[child])
+            i += 1
+
+        kept = np.array(order, dtype=np.int64)
+        mapping = np.full(self.size + 1, NO_NODE, dtype=np.int32)
+        mapping[kept] = np.arange(len(kept), dtype=np.int32)
+        for name in self._ARRAYS:
+            values = getattr(self, name)[kept]
+            if name in self._POINTERS:
+                # NO_NODE indexes the extra last slot of mapping, which stays NO_NODE
+                values = mapping[values]
+            getattr(self, name)[: len(kept)] = values
+        self.parent[0] = NO_NODE
+        self.next_sibling[0] = NO_NODE
+        self.size = len(kept)
+        return self.size
+
+
+class MCTS:
+    def __init__(
+        self,
+        model: SearchModel,
+        c_puct: float = 1.5,
+        capacity: int = 1 << 16,
+        max_nodes: Optional[int] = None,
+        transpositions: Optional[TranspositionTable] = None,
+        in_place: bool = False,
+    ):
+        """
+        Once the tree holds max_nodes nodes, leaves are evaluated without being added. With
+        transpositions, the model must be a HashedModel and leaf values go through the table.
+        With in_place, the model must be an InPlaceModel: every simulation walks the state
+        passed to search down with make() and back up with unmake() instead of stepping
+        through copies, so evaluate() must leave its state as it found it.
+        """
+        self.model = model
+        self.c_puct = c_puct
+        self.max_nodes = max_nodes
+        self.transpositions = transpositions
+        self.in_place = in_place
+        self._undo: list[Any] = []
+        self.tree = Tree(capacity if max_nodes is None else min(capacity, max_nodes))
+
+    def reset(self):
+        self.tree.reset()
+
+    def _full(self, count: int) -> bool:
+        return self.max_nodes is not None and self.tree.size + count > self.max_nodes
+
+    def advance(self, action: int, outcome: Union[int, Sequence[int]]) -> bool:
+        """
+        Keeps the subtree reached by playing action and observing outcome for the next search;
+        outcome may also list keys nearest first (e.g. DoublesModel.observation_keys), the
+        first one the search reached being kept. Resets the tree and returns False if the
+        search reached none.
+        """
+        tree = self.tree
+        node = NO_NODE
+        action_node = self.action_child(ROOT, action)
+        if action_node != NO_NODE:
+            if isinstance(outcome, int):
+                node = tree.find_outcome(action_node, outcome)
+            else:
+                reached = {}
+                child = tree.first_child[action_node]
+                while child != NO_NODE:
+                    reached[int(tree.key[child])] = child
+                    child = tree.next_sibling[child]
+                node = next((reached[key] for key in outcome if key in reached), NO_NODE)
+        if node == NO_NODE:
+            self.reset()
+            return False
+        tree.reroot(node)
+        return True
+
+    def action_child(self, node: int, action: int) -> int:
+        """
+        Action node of decision node for action id, NO_NODE if it has none
+        """
+        tree = self.tree
+        for child in tree.children(node):
+            if tree.key[child] == action:
+                return child
+        return NO_NODE
+
+    def search(
+        self,
+        state: Any,
+        simulations: Optional[int] = None,
+        deadline: Optional[float] = None,
+        check_every: int = 16,
+        batch_size: int = 1,
+        evaluate_many: Optional[Callable[[list[Any]], Sequence[float]]] = None,
+    ) -> int:
+        """
+        Simulates until simulations are done or time.perf_counter() passes deadline, reading
+        the clock once every check_every simulations; returns the number of simulations run.
+        With batch_size > 1 leaves are evaluated batch_size at a time by evaluate_many
+        (default: the model's own, if it has one) and the clock is read at least once a batch.
+        """
+        assert simulations is not None or deadline is not None
+        check_every = max(check_every, batch_size)
+        done = 0
+        while simulations is None or done < simulations:
+            batch = check_every if simulations is None else min(check_every, simulations - done)
+            if batch_size > 1:
+                for start in range(0, batch, batch_size):
+                    self.simulate_batch(state, min(batch_size, batch - start), evaluate_many or self._evaluate_many)
+            else:
+                for _ in range(batch):
+                    self.simulate(state)
+            done += batch
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        return done
+
+    async def search_async(
+        self,
+        state: Any,
+        deadline: float,
+        simulations: Optional[int] = None,
+        slice_seconds: float = 0.005,
+        evaluate_many_async: Optional[Callable[[list[Any]], Awaitable[Sequence[float]]]] = None,
+        **search_options,
+    ) -> int:
+        """
+        Anytime search that hands control back to the event loop every slice_seconds, so the
+        websocket keeps being serviced while we think; search_options go to search. With
+        evaluate_many_async leaves are evaluated batch_size at a time by awaiting it, e.g.
+        on worker processes, and the loop runs while each batch is out.
+        """
+        done = 0
+        if evaluate_many_async is not None:
+            batch_size = search_options.get("batch_size", 1)
+            while time.perf_counter() < deadline and (simulations is None or done < simulations):
+                batch = batch_size if simulations is None else min(batch_size, simulations - done)
+                await self.simulate_batch_async(state, batch, evaluate_many_async)
+                done += batch
+            return done
+        while time.perf_counter() < deadline and (simulations is None or done < simulations):
+            slice_end = min(deadline, time.perf_counter() + slice_seconds)
+            remaining = None if simulations is None else simulations - done
+            done += self.search(state, remaining, slice_end, **search_options)
+            await asyncio.sleep(0)
+        return done
+
+    def simulate(self, state: Any):
+        path, leaf_state, value, leaf = self._descend(state)
+        if value is None:
+            if leaf != NO_NODE:
+                self.expand(leaf, leaf_state)
+            if self.transpositions is None:
+                value = self.model.evaluate(leaf_state)
+            else:
+                value = self._leaf_values([leaf_state], self._evaluate_many)[0]
+        self.backpropagate(path, value)
+        self._restore(state)
+
+    def _restore(self, state: Any):
+        while self._undo:
+            self.model.unmake(state, self._undo.pop())
+
+    def simulate_batch(
+        self,
+        state: Any,
+        batch_size: int,
+        evaluate_many: Callable[[list[Any]], Sequence[float]],
+        virtual_loss: int = 1,
+    ):
+        """
+        Descends batch_size times before evaluating the reached leaves together with
+        evaluate_many; every pending path carries virtual_loss extra lost visits so later
+        descents in the batch spread out over the tree
+        """
+        pending = self._descend_batch(state, batch_size, virtual_loss)
+        if pending:
+            values = self._leaf_values([leaf_state for _, leaf_state in pending], evaluate_many)
+            self._backpropagate_batch(pending, values, virtual_loss)
+
+    async def simulate_batch_async(
+        self,
+        state: Any,
+        batch_size: int,
+        evaluate_many_async: Callable[[list[Any]], Awaitable[Sequence[float]]],
+        virtual_loss: int = 1,
+    ):
+        """
+        simulate_batch awaiting evaluate_many_async for the leaves
+        """
+        pending = self._descend_batch(state, batch_size, virtual_loss)
+        if pending:
+            states = [leaf_state for _, leaf_state in pending]
+            keys, values, missing = self._stored_values(states)
+            if missing:
+                computed = await evaluate_many_async([states[i] for i in missing])
+                self._store_values(keys, values, missing, computed)
+            self._backpropagate_batch(pending, values, virtual_loss)
+
+    def _descend_batch(self, state: Any, batch_size: int, virtual_loss: int) -> list[tuple[list[int], Any]]:
+        """
+        Paths and leaf states of batch_size descents still to be evaluated, their paths
+        carrying virtual_loss; terminal leaves are backed up straight away
+        """
+        tree = self.tree
+        pending = []
+        for _ in range(batch_size):
+            path, leaf_state, value, leaf = self._descend(state)
+            if value is not None:
+                self.backpropagate(path, value)
+                self._restore(state)
+                continue
+            if leaf != NO_NODE and tree.first_child[leaf] == NO_NODE:
+                self.expand(leaf, leaf_state)
+            if self.in_place:
+                # the leaf must outlive this descent's unmake
+                leaf_state = self.model.snapshot(leaf_state)
+                self._restore(state)
+            for node in path:
+                tree.visits[node] += virtual_loss
+            pending.append((path, leaf_state))
+        return pending
+
+    def _backpropagate_batch(self, pending: list[tuple[list[int], Any]], values: Sequence[float], virtual_loss: int):
+        tree = self.tree
+        for (path, _), value in zip(pending, values):
+            for node in path:
+                tree.visits[node] -= virtual_loss
+            self.backpropagate(path, value)
+
+    def _descend(self, state: Any) -> tuple[list[int], Any, Optional[float], int]:
+        """
+        Selects down to a leaf: returns the path, the leaf's state, its terminal value (None
+        if it needs evaluating) and the leaf node, NO_NODE if it could not be stored. With
+        in_place the leaf's state is state itself, to be restored with _restore.
+        """
+        tree = self.tree
+        path = [ROOT]
+        node = ROOT
+        value = self.model.terminal_value(state)
+        while value is None and tree.first_child[node] != NO_NODE:
+            edge = self.select_edge(node)
+            action_node = edge[-1]
+            if self.in_place:
+                outcome, undo = self.model.make(state, int(tree.key[action_node]))
+                self._undo.append(undo)
+            else:
+                state, outcome = self.model.step(state, int(tree.key[action_node]))
+            path.extend(edge)
+            node = tree.find_outcome(action_node, outcome)
+            if node == NO_NODE:
+                if self._full(1):
+                    # no room for the new outcome: evaluate it without storing it
+                    return path, state, self.model.terminal_value(state), NO_NODE
+                node = tree.outcome_child(action_node, outcome)
+            path.append(node)
+            value = self.model.terminal_value(state)
+        return path, state, value, node
+
+    def _leaf_values(self, states: list[Any], evaluate_many: Callable[[list[Any]], Sequence[float]]) -> list[float]:
+        """
+        Values of leaf states: the transposition table's mean for states it has sampled
+        enough, else evaluate_many's value averaged into the states' stored evaluations
+        """
+        if self.transpositions is None:
+            return list(evaluate_many(states))
+        keys, values, missing = self._stored_values(states)
+        if missing:
+            self._store_values(keys, values, missing, evaluate_many([states[i] for i in missing]))
+        return values
+
+    def _stored_values(self, states: list[Any]) -> tuple[Optional[list[int]], list[Optional[float]], list[int]]:
+        """
+        The states' keys, their values from the transposition table (None where it has
+        none) and the positions of the missing values
+        """
+        table = self.transpositions
+        if table is None:
+            return None, [None] * len(states), list(range(len(states)))
+        keys = [self.model.state_key(state) for state in states]
+        values = [table.value(key) for key in keys]
+        return keys, values, [i for i, value in enumerate(values) if value is None]
+
+    def _store_values(
+        self, keys: Optional[list[int]], values: list[Optional[float]], missing: list[int], computed: Sequence[float]
+    ):
+        for i, value in zip(missing, computed):
+            values[i] = value if keys is None else self.transpositions.store(keys[i], value)
+
+    def _evaluate_many(self, states: list[Any]) -> list[float]:
+        if len(states) == 1:
+            return [self.model.evaluate(states[0])]
+        return _evaluate_chunk(self.model, states)
+
+    def select_edge(self, node: int) -> list[int]:
+        """
+        Nodes a descent through decision node passes before its next decision node, ending
+        with the chosen action node; every one of them is backed up
+        """
+        return [self.select(node)]
+
+    def scores(self, node: int, children: Union[slice, np.ndarray]) -> np.ndarray:
+        """
+        PUCT scores of children (a slice or an index array) of decision node
+        """
+        tree = self.tree
+        parent_visits = int(tree.visits[node])
+        parent_q = float(tree.value_sum[node]) / parent_visits if parent_visits else 0.5
+        # (W + Q_parent + c * P * sqrt(N)) / (n + 1): the PUCT score with every child
+        # starting from one virtual visit at its parent's mean, in few in-place array ops
+        scores = tree.prior[children] * (self.c_puct * math.sqrt(max(parent_visits, 1)))
+        scores += tree.value_sum[children]
+        scores += parent_q
+        scores /= tree.visits[children] + 1
+        return scores
+
+    def select(self, node: int) -> int:
+        """
+        PUCT over the contiguous children of a decision node
+        """
+        start = int(self.tree.first_child[node])
+        return start + int(self.scores(node, slice(start, start + int(self.tree.n_children[node]))).argmax())
+
+    def expand(self, node: int, state: Any):
+        actions = self.model.legal_actions(state)
+        if not actions or self._full(len(actions)):
+            return
+        tree = self.tree
+        start = tree.allocate(len(actions), parent=node)
+        end = start + len(actions)
+        tree.key[start:end] = actions
+        priors = self.model.priors(state, actions)
+        tree.prior[start:end] = priors if priors is not None else 1 / len(actions)
+        tree.first_child[node] = start
+        tree.n_children[node] = len(actions)
+
+    def backpropagate(self, path: list[int], value: float):
+        visits, value_sum = self.tree.visits, self.tree.value_sum
+        for node in path:
+            visits[node] += 1
+            value_sum[node] += value
+
+    def root_statistics(self) -> RootStatistics:
+        """
+        (action ids, visit counts, mean values) of the root's children
+        """
+        children = self.tree.children(ROOT)
+        return self._statistics(slice(children.start, children.stop))
+
+    def _statistics(self, children: Union[slice, np.ndarray]) -> RootStatistics:
+        tree = self.tree
+        visits = tree.visits[children]
+        values = np.divide(tree.value_sum[children], visits, out=np.zeros(len(visits)), where=visits > 0)
+        return tree.key[children].copy(), visits.copy(), values
+
+    def best_action(self, legal: Optional[Sequence[int]] = None) -> Optional[int]:
+        """
+        Most visited root action among legal (default all), ties broken by value
+        """
+        return best_root_action(self.root_statistics(), legal)
+
+
+class FactoredMCTS(MCTS):
+    """
+    MCTS over two-slot joint actions with a decoupled PUCT bandit per slot. A descent takes
+    the best compatible pair of slot arms; a decision node visited N times stores at most
+    widening * (N + 1) ** widening_exponent joint actions, and when the best pair is not
+    stored and may not be added yet, the stored joint actions compete by PUCT instead.
+    """
+
+    def __init__(
+        self,
+        model: FactoredModel,
+        c_puct: float = 1.5,
+        capacity: int = 1 << 16,
+        max_nodes: Optional[int] = None,
+        widening: float = 1.0,
+        widening_exponent: float = 0.5,
+        transpositions: Optional[TranspositionTable] = None,
+        in_place: bool = False,
+    ):
+        super().__init__(model, c_puct, capacity, max_nodes, transpositions, in_place)
+        self.widening = widening
+        self.widening_exponent = widening_exponent
+
+    def action_child(self, node: int, action: int) -> int:
+        return self.tree.find_joint(node, action)
+
+    def _slots(self, node: int) -> tuple[slice, slice]:
+        tree = self.tree
+        start = int(tree.first_child[node])
+        split = start + int(tree.split[node])
+        return slice(start, split), slice(split, start + int(tree.n_children[node]))
+
+    def select_edge(self, node: int) -> list[int]:
+        tree = self.tree
+        first, second = self.select_arms(node)
+        joint = tree.find_joint(node, self.model.join(int(tree.key[first]), int(tree.key[second])))
+        if joint == NO_NODE:
+            joints = tree.joints(node)
+            limit = self.widening * (int(tree.visits[node]) + 1) ** self.widening_exponent
+            if len(joints) < limit and not self._full(1):
+                joint = self._add_joint(node, first, second)
+            else:
+                index = np.array(joints, dtype=np.int64)
+                joint = int(index[self.scores(node, index).argmax()])
+                first, second = self._arms_of(node, joint)
+        return [first, second, joint]
+
+    def select_arms(self, node: int) -> tuple[int, int]:
+        """
+        Best scoring pair of slot arms the model allows together
+        """
+        tree = self.tree
+        firsts, seconds = self._slots(node)
+        first_scores, second_scores = self.scores(node, firsts), self.scores(node, seconds)
+        first = firsts.start + int(first_scores.argmax())
+        second = seconds.start + int(second_scores.argmax())
+        if self.model.compatible(int(tree.key[first]), int(tree.key[second])):
+            return first, second
+        # the best arms clash (double tera, both switching to the same mon): best compatible sum
+        totals = first_scores[:, None] + second_scores[None, :]
+        for pair in np.argsort(totals, axis=None)[::-1].tolist():
+            i, j = divmod(pair, len(second_scores))
+            first, second = firsts.start + i, seconds.start + j
+            if self.model.compatible(int(tree.key[first]), int(tree.key[second])):
+                return first, second
+        raise ValueError(f"no compatible slot actions at node {node}")
+
+    def _arms_of(self, node: int, joint: int) -> tuple[int, int]:
+        tree = self.tree
+        first, second = self.model.factor(int(tree.key[joint]))
+        firsts, seconds = self._slots(node)
+        return (
+            firsts.start + int(np.flatnonzero(tree.key[firsts] == first)[0]),
+            seconds.start + int(np.flatnonzero(tree.key[seconds] == second)[0]),
+        )
+
+    def _add_joint(self, node: int, first: int, second: int) -> int:
+        tree = self.tree
+        joint = tree.allocate(1, parent=node)
+        tree.key[joint] = self.model.join(int(tree.key[first]), int(tree.key[second]))
+        tree.prior[joint] = tree.prior[first] * tree.prior[second]
+        tree.next_sibling[joint] = tree.first_joint[node]
+        tree.first_joint[node] = joint
+        return joint
+
+    def expand(self, node: int, state: Any):
+        actions = self.model.legal_actions(state)
+        if not actions:
+            return
+        slots = [self.model.factor(action) for action in actions]
+        firsts = list(dict.fromkeys(first for first, _ in slots))
+        seconds = list(dict.fromkeys(second for _, second in slots))
+        count = len(firsts) + len(seconds)
+        # leave room for a first joint action so every expanded node can be descended through
+        if self._full(count + 1):
+            return
+        tree = self.tree
+        start = tree.allocate(count, parent=node)
+        split = start + len(firsts)
+        tree.key[start : start + count] = firsts + seconds
+        priors = self.model.priors(state, actions)
+        if priors is None:
+            tree.prior[start:split] = 1 / len(firsts)
+            tree.prior[split : start + count] = 1 / len(seconds)
+        else:
+            # an arm's prior is the mass of the joint actions using it
+            first_index = {first: start + i for i, first in enumerate(firsts)}
+            second_index = {second: split + i for i, second in enumerate(seconds)}
+            np.add.at(tree.prior, [first_index[first] for first, _ in slots], priors)
+            np.add.at(tree.prior, [second_index[second] for _, second in slots], priors)
+        tree.first_child[node] = start
+        tree.n_children[node] = count
+        tree.split[node] = len(firsts)
+        self._add_joint(node, *self.select_arms(node))
+
+    def root_statistics(self) -> RootStatistics:
+        """
+        (action ids, visit counts, mean values) of the root's joint actions
+        """
+        return self._statistics(np.array(self.tree.joints(ROOT), dtype=np.int64))
+
+
+def merge_root_statistics(results: Sequence[RootStatistics]) -> RootStatistics:
+    """
+    Sums the visits of every root action over independent trees, values weighted by visits
+    """
+    visits: dict[int, float] = {}
+    value_sums: dict[int, float] = {}
+    for actions, action_visits, values in results:
+        for action, n, q in zip(actions.tolist(), action_visits.tolist(), values.tolist()):
+            visits[action] = visits.get(action, 0) + n
+            value_sums[action] = value_sums.get(action, 0.0) + n * q
+    actions = np.array(list(visits), dtype=np.int64)
+    merged_visits = np.array([visits[a] for a in visits], dtype=np.int64)
+    merged_values = np.array([value_sums[a] / visits[a] if visits[a] else 0.0 for a in visits])
+    return actions, merged_visits, merged_values
+
+
+def best_root_action(statistics: RootStatistics, legal: Optional[Sequence[int]] = None) -> Optional[int]:
+    """
+    Most visited action among legal (default all), ties broken by value
+    """
+    actions, visits, values = statistics
+    if legal is not None:
+        keep = np.isin(actions, legal)
+        actions, visits, values = actions[keep], visits[keep], values[keep]
+    if not len(actions):
+        return None
+    return int(actions[np.lexsort((values, visits))[-1]])
+
+
+def _root_search(
+    model: SearchModel,
+    state: Any,
+    seed: int,
+    seconds: float,
+    simulations: Optional[int],
+    c_puct: float,
+    max_nodes: Optional[int],
+    engine: Callable[..., MCTS],
+) -> RootStatistics:
+    random.seed(seed)
+    np.random.seed(seed % (1 << 32))
+    search = engine(model, c_puct=c_puct, max_nodes=max_nodes)
+    search.search(state, simulations, time.perf_counter() + seconds)
+    return search.root_statistics()
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _evaluate_chunk(model: SearchModel, states: list[Any]) -> list[float]:
+    if hasattr(model, "evaluate_many"):
+        return list(model.evaluate_many(states))
+    return [model.evaluate(state) for state in states]
+
+
+class ParallelSearch:
+    """
+    Process pool for root parallel search (independent trees per worker, root statistics
+    merged) and leaf parallel evaluation (one tree, leaves evaluated by the workers).
+
+    Models and states are pickled to the workers. The agent's process already runs
+    poke_env's websocket thread, which a plain fork would copy mid-flight, so workers come
+    from a forkserver (spawn where there is none) and are all started in __init__, each
+    running preload() first, instead of on the first search of a battle.
+    """
+
+    def __init__(self, workers: int, preload: Optional[Callable[[], None]] = None):
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        self.workers = workers
+        self.pool = ProcessPoolExecutor(workers, mp_context=context, initializer=preload)
+        # submitted together, the tasks find no idle worker and each starts its own
+        for future in [self.pool.submit(_worker_ready) for _ in range(workers)]:
+            future.result()
+
+    def shutdown(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    async def root_search(
+        self,
+        model: SearchModel,
+        state: Any,
+        seconds: float,
+        simulations: Optional[int] = None,
+        c_puct: float = 1.5,
+        max_nodes: Optional[int] = None,
+        engine: Callable[..., MCTS] = MCTS,
+    ) -> RootStatistics:
+        """
+        Runs one engine tree per worker for seconds (or simulations / workers each) without
+        blocking the event loop and merges their root statistics
+        """
+        per_worker = None if simulations is None else -(-simulations // self.workers)
+        seed = random.getrandbits(32)
+        futures = [
+            asyncio.wrap_future(
+                self.pool.submit(
+                    _root_search, model, state, seed + i, seconds, per_worker, c_puct, max_nodes, engine
+                )
+            )
+            for i in range(self.workers)
+        ]
+        return merge_root_statistics(await asyncio.gather(*futures))
+
+    def _submit_chunks(self, model: SearchModel, states: list[Any]) -> list[Future]:
+        size = -(-len(states) // self.workers)
+        return [self.pool.submit(_evaluate_chunk, model, states[i : i + size]) for i in range(0, len(states), size)]
+
+    def evaluate_many(self, model: SearchModel) -> Callable[[list[Any]], list[float]]:
+        """
+        evaluate_many for MCTS.search(batch_size=...) that splits each batch over the workers;
+        it waits for them, so use evaluate_many_async from the event loop
+        """
+
+        def evaluate(states: list[Any]) -> list[float]:
+            return [value for future in self._submit_chunks(model, states) for value in future.result()]
+
+        return evaluate
+
+    def evaluate_many_async(self, model: SearchModel) -> Callable[[list[Any]], Awaitable[list[float]]]:
+        """
+        evaluate_many for MCTS.search_async(evaluate_many_async=...): awaits the workers, so
+        the event loop keeps running while they evaluate a batch
+        """
+
+        async def evaluate(states: list[Any]) -> list[float]:
+            chunks = await asyncio.gather(
+                *(asyncio.wrap_future(future) for future in self._submit_chunks(model, states))
+            )
+            return [value for chunk in chunks for value in chunk]
+
+        return evaluate
@@ -1,5 +1,268 @@
-from poke_env.player import Player
+import functools
 import random
-from random import randint
-from poke_env.environment import Battle
-class mctsAgent(Player):
\ No newline at end of file
+import re
+import time
+from typing import Optional, Sequence
+
+from poke_env.battle import DoubleBattle, Move, Pokemon
+from poke_env.data import GenData
+from poke_env.environment import DoublesEnv
+from poke_env.player import DoubleBattleOrder, Player, SingleBattleOrder
+
+from battle_model import SLOT_ACTIONS, DoublesModel
+from latency import instrumented
+from mcts import MCTS, FactoredMCTS, ParallelSearch, TranspositionTable, best_root_action
+from team_catalog import load_catalog
+
+_TURN_TIME = re.compile(r"(\d+) sec this turn")
+_TOTAL_TIME = re.compile(r"(\d+) sec total")
+# moves that can hit either side and are worth aiming at the partner
+ALLY_TARGET_MOVES = frozenset(
+    {"pollenpuff", "healpulse", "floralhealing", "beatup", "decorate", "instruct", "afteryou", "skillswap"}
+)
+
+
+def joint_action_id(order: DoubleBattleOrder, battle: DoubleBattle) -> int:
+    first, second = DoublesEnv.order_to_action(order, battle, fake=True, strict=False)
+    return int(first) * SLOT_ACTIONS + int(second)
+
+
+def slot_orders(battle: DoubleBattle, slot: int) -> list[SingleBattleOrder]:
+    """
+    Every order the mon in slot can be given this turn; moves that could hit a foe are only
+    aimed at the partner if they are in ALLY_TARGET_MOVES
+    """
+    mon = battle.active_pokemon[slot]
+    switches = [SingleBattleOrder(switch) for switch in battle.available_switches[slot]]
+    if battle.force_switch[slot] or mon is None:
+        return switches if battle.force_switch[slot] else []
+    orders = []
+    for move in battle.available_moves[slot]:
+        targets = battle.get_possible_showdown_targets(move, mon)
+        if move.id not in ALLY_TARGET_MOVES and any(target > 0 for target in targets):
+            targets = [target for target in targets if target >= 0]
+        for target in targets:
+            orders.append(SingleBattleOrder(move, move_target=target))
+            if battle.can_tera[slot]:
+                orders.append(SingleBattleOrder(move, move_target=target, terastallize=True))
+    return orders + switches
+
+
+def joint_orders(battle: DoubleBattle) -> list[DoubleBattleOrder]:
+    """
+    Every legal pair of slot orders (join_orders drops double tera and double switches)
+    """
+    return DoubleBattleOrder.join_orders(slot_orders(battle, 0), slot_orders(battle, 1))
+
+
+def order_value(order: Optional[SingleBattleOrder], battle: DoubleBattle, slot: int) -> float:
+    """
+    Rough value in [0, 1] of a single slot order: effective base power for moves
+    """
+    if order is None:
+        return 0.0
+    if isinstance(order.order, Pokemon):
+        return 0.2
+    move: Move = order.order
+    mon = battle.active_pokemon[slot]
+    if move.base_power == 0:
+        return 0.3 if move.is_protect_move else 0.25
+    if order.move_target < 0:
+        # at the partner: healing or a deliberate trigger, never worth a damaging move's prior
+        return 0.25 if move.id in ALLY_TARGET_MOVES else 0.0
+    if order.move_target in (1, 2):
+        targets = [battle.opponent_active_pokemon[order.move_target - 1]]
+    else:
+        targets = [t for t in battle.opponent_active_pokemon if t is not None]
+    power = sum(
+        move.base_power * target.damage_multiplier(move) * (mon.stab_multiplier if mon and move.type in mon.types else 1)
+        for target in targets
+        if target is not None
+    )
+    return min(1.0, power / 300) * (1.1 if order.terastallize else 1.0)
+
+
+def search_model(
+    battle: DoubleBattle, orders: Sequence[DoubleBattleOrder], rollout_turns: int = 2
+) -> tuple[DoublesModel, dict[int, DoubleBattleOrder]]:
+    """
+    Forward model of battle whose root actions are exactly orders, with priors following
+    order_value, and the orders by action id
+    """
+    by_action = {joint_action_id(order, battle): order for order in orders}
+    values = [
+        0.05 + (order_value(order.first_order, battle, 0) + order_value(order.second_order, battle, 1)) / 2
+        for order in by_action.values()
+    ]
+    total = sum(values)
+    model = DoublesModel(battle, list(by_action), [value / total for value in values], rollout_turns)
+    return model, by_action
+
+
+def _preload_shared_data():
+    # loaded by each search worker as it starts instead of during its first search
+    GenData.from_gen(9)
+    load_catalog()
+
+
+class TimeBudget:
+    """
+    Thinking time for one battle under Showdown's VGC timer: a per-turn cap and a game bank
+    shared by every turn, both shrunk by a safety margin for latency
+    """
+
+    def __init__(
+        self,
+        per_turn: float = 45.0,
+        bank: float = 420.0,
+        expected_turns: int = 12,
+        margin: float = 2.0,
+        minimum: float = 0.05,
+    ):
+        self.per_turn = per_turn
+        self.bank = bank
+        self.expected_turns = expected_turns
+        self.margin = margin
+        self.minimum = minimum
+        self.turns = 0
+
+    def allot(self) -> float:
+        """
+        Seconds to think this turn: an even share of the bank over the turns still expected
+        """
+        share = self.bank / max(self.expected_turns - self.turns, 2)
+        return max(self.minimum, min(self.per_turn, share) - self.margin)
+
+    def spend(self, seconds: float):
+        self.bank = max(0.0, self.bank - seconds)
+        self.turns += 1
+
+    def observe(self, message: str):
+        """
+        Syncs with the server's `|inactive|Time left: ...` message
+        """
+        turn = _TURN_TIME.search(message)
+        total = _TOTAL_TIME.search(message)
+        if turn:
+            self.per_turn = float(turn.group(1))
+        if total:
+            self.bank = float(total.group(1))
+
+
+@instrumented
+class mctsAgent(Player):
+    def __init__(
+        self,
+        simulations: Optional[int] = None,
+        c_puct: float = 1.5,
+        time_budget: Optional[dict] = None,
+        max_nodes: int = 1 << 20,
+        workers: int = 1,
+        leaf_batch: int = 64,
+        factored: bool = True,
+        widening: float = 1.0,
+        transposition_slots: int = 1 << 16,
+        rollout_turns: int = 2,
+        **kwargs,
+    ):
+        """
+        Searches until the turn's time budget runs out, or for simulations if that comes first;
+        time_budget holds TimeBudget keyword arguments and max_nodes bounds each battle's tree.
+        With workers > 1 every worker process searches its own tree and root statistics are
+        merged (no tree reuse across turns), unless leaf_batch > 1, in which case one tree is
+        kept and leaves are evaluated leaf_batch at a time across the workers. On one process
+        leaf_batch > 1 evaluates leaves in batches too, whose rollouts the model plays
+        vectorized (DoublesModel.evaluate_many, which pays off from a few dozen). factored picks
+        each slot's order with its own bandit and widens the joint orders tried at a node by
+        progressive widening (see FactoredMCTS), instead of a bandit over every joint order.
+        Each battle's tree shares leaf values between equal states through a transposition
+        table of transposition_slots entries (0 disables it), a state's value being the mean
+        of its first few rollouts. Leaves are valued by playing
+        rollout_turns random turns in the forward model (battle_model.DoublesModel).
+        """
+        super().__init__(**kwargs)
+        self.simulations = simulations
+        self.c_puct = c_puct
+        self.time_budget = time_budget or {}
+        self.max_nodes = max_nodes
+        self.budgets: dict[str, TimeBudget] = {}
+        # per battle: the tree kept from the previous turn and the action we played from it
+        self.searches: dict[str, MCTS] = {}
+        self.last_actions: dict[str, int] = {}
+        self.leaf_batch = leaf_batch
+        if factored:
+            self.engine = functools.partial(FactoredMCTS, widening=widening, in_place=True)
+        else:
+            self.engine = functools.partial(MCTS, in_place=True)
+        self.transposition_slots = transposition_slots
+        self.rollout_turns = rollout_turns
+        self.parallel = ParallelSearch(workers, preload=_preload_shared_data) if workers > 1 else None
+
+    def budget(self, battle) -> TimeBudget:
+        if battle.battle_tag not in self.budgets:
+            self.budgets[battle.battle_tag] = TimeBudget(**self.time_budget)
+        return self.budgets[battle.battle_tag]
+
+    async def _handle_battle_message(self, split_messages: list[list[str]]):
+        for split_message in split_messages[1:]:
+            if len(split_message) > 2 and split_message[1] == "inactive":
+                battle_tag = split_messages[0][0][1:]
+                if battle_tag in self.budgets:
+                    self.budgets[battle_tag].observe(split_message[2])
+        await super()._handle_battle_message(split_messages)
+
+    def _battle_finished_callback(self, battle):
+        self.budgets.pop(battle.battle_tag, None)
+        self.searches.pop(battle.battle_tag, None)
+        self.last_actions.pop(battle.battle_tag, None)
+
+    def search_for(self, battle, model) -> MCTS:
+        """
+        The previous turn's tree re-rooted on what happened since, or a fresh one
+        """
+        search = self.searches.get(battle.battle_tag)
+        last_action = self.last_actions.pop(battle.battle_tag, None)
+        if search is None:
+            table = TranspositionTable(self.transposition_slots) if self.transposition_slots else None
+            search = self.engine(model, c_puct=self.c_puct, max_nodes=self.max_nodes, transpositions=table)
+            self.searches[battle.battle_tag] = search
+        elif last_action is None:
+            search.reset()
+        else:
+            search.advance(last_action, model.observation_keys())
+        if search.transpositions is not None:
+            search.transpositions.new_generation()
+        search.model = model
+        return search
+
+    async def choose_move(self, battle):
+        if not isinstance(battle, DoubleBattle):
+            return self.choose_random_move(battle)
+        orders = joint_orders(battle)
+        if not orders:
+            return self.choose_default_move()
+        budget = self.budget(battle)
+        start = time.perf_counter()
+        model, by_action = search_model(battle, orders, self.rollout_turns)
+        if self.parallel is not None and self.leaf_batch <= 1:
+            statistics = await self.parallel.root_search(
+                model, model.root, budget.allot(), self.simulations, self.c_puct, self.max_nodes, self.engine
+            )
+            budget.spend(time.perf_counter() - start)
+            action = best_root_action(statistics, list(by_action))
+            return by_action[action] if action is not None else random.choice(orders)
+
+        search = self.search_for(battle, model)
+        options = {}
+        if self.leaf_batch > 1:
+            options["batch_size"] = self.leaf_batch
+            if self.parallel is not None:
+                options["evaluate_many_async"] = self.parallel.evaluate_many_async(model)
+        await search.search_async(model.root, start + budget.allot(), self.simulations, **options)
+        budget.spend(time.perf_counter() - start)
+        # a reused tree may hold actions that are no longer legal
+        action = search.best_action(list(by_action))
+        if action is None:
+            return random.choice(orders)
+        self.last_actions[battle.battle_tag] = action
+        return by_action[action]
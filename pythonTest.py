@@ -6,36 +6,53 @@ from poke_env import RandomPlayer
 from poke_env.data import GenData
 import sys
 import random
-from teams import TEAMS, RandomTeamBuilder, team
-from poke_env.ps_client import AccountConfiguration
-from poke_env.environment import DoubleBattle
+from typing import Optional
+from battle_archive import BattleArchiveWriter
+from latency import instrumented
+from selfplay import SelfPlayRunner
+from server_pool import ServerPool, ShardedSelfPlayRunner
+from teams import RandomTeamBuilder, team_count
+from poke_env.battle import DoubleBattle, Pokemon
 from poke_env.player.battle_order import DoubleBattleOrder
-from poke_env.environment import DoublesEnv
 
 # import mctsAgent
 
 sys.path.append("../src")
 
 
+@instrumented
 class YourFirstAgent(Player):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # self.gen_data = GenData.from_gen(9)
-    def something(self, i, battle):
-        for move in battle.available_moves[i]:
-                # print("TYPE OF MOVE HERE: ", type(move), "\n")
-            if move.base_power >= 80:
-                    # A powerful move! Let's use it
-                return self.create_order(move)
-                # No available move? Let's switch then!
-        for switch in battle.available_switches[i]:
-            if (
-                switch.current_hp_fraction
-                > battle.active_pokemon[i].current_hp_fraction
-            ):
+    def something(self, i, battle, fallback, taken=None):
+        # taken is the first slot's order, so that both slots never switch to the same mon
+        mon = battle.active_pokemon[i]
+        if any(battle.force_switch) and not battle.force_switch[i]:
+            # the other slot is the one being replaced
+            return None
+        if mon is None and not battle.force_switch[i]:
+            # an empty slot
+            return None
+        taken_mon = taken.order if taken is not None and isinstance(taken.order, Pokemon) else None
+        switches = [switch for switch in battle.available_switches[i] if switch is not taken_mon]
+        if not battle.force_switch[i]:
+            for move in battle.available_moves[i]:
+                    # print("TYPE OF MOVE HERE: ", type(move), "\n")
+                if move.base_power >= 80:
+                        # A powerful move! Let's use it
+                    targets = [t for t in battle.get_possible_showdown_targets(move, mon) if t > 0]
+                    return self.create_order(move, move_target=targets[0] if targets else 0)
+                    # No available move? Let's switch then!
+        for switch in switches:
+            if mon is None or battle.force_switch[i] or switch.current_hp_fraction > mon.current_hp_fraction:
                 # This other pokemon has more HP left... Let's switch it in?
                 return self.create_order(switch)
-        return (self.choose_random_move(battle))
+        # a random order for this slot only; the random double order holds both slots
+        order = fallback.first_order if i == 0 else fallback.second_order
+        if order is not None and taken_mon is not None and order.order is taken_mon:
+            return self.create_order(switches[0]) if switches else None
+        return order
     def choose_move_single(self, battle):
         for move in battle.available_moves:
             print("TYPE OF MOVE HERE: ", type(move), "\n")
@@ -54,54 +71,65 @@ class YourFirstAgent(Player):
 
     def choose_move(self, battle):
         if isinstance(battle, DoubleBattle):
-            return DoublesEnv.action_to_order
+            return self.choose_move_double(battle)
         else:
             return self.choose_move_single(battle)
 
     def choose_move_double(self, battle):
-        order = []
-        for i in range(2):
-            order.append(self.something(i, battle))
-        return DoubleBattleOrder(*order)
+        fallback = self.choose_random_doubles_move(battle)
+        first = self.something(0, battle, fallback)
+        return DoubleBattleOrder(first, self.something(1, battle, fallback, taken=first))
     async def _handle_ots_request(self, battle_tag: str):
         pass
 
 
-battle_format = "gen9vgc2025regh"
-team_ids = list(range(len(TEAMS[battle_format[-4:]])))
-# random.Random(0).shuffle(team_ids)
-# team1 = RandomTeamBuilder(team_ids[:1])
-# team2 = RandomTeamBuilder(team_ids[1:2])
-# print(team1)
-# print(team2)
-# RandomTeamBuilder(team_ids, battle_format)
-firstAgent = YourFirstAgent(
-    account_configuration=AccountConfiguration("wduhwiduhwi", "kyskyskys"),
-    battle_format=battle_format,
-    team=team,
-)
-second_player = YourFirstAgent(
-    account_configuration=AccountConfiguration("sduhiduhwidhine", "djiwjdiwjdoijwdojo"),
-    battle_format=battle_format,
-    team=team,
-)
-
-
 # for the project we are concerned with gen 9 vgc 2025 reg i format
 # for testing purposes, we are going to use regulation G since someone already has team selection for that
-async def battle():
-    await firstAgent.battle_against(second_player, n_battles=1)
-
-
-asyncio.run(battle())
-print(
-    f"Player {firstAgent.username} won {firstAgent.n_won_battles} out of {firstAgent.n_finished_battles} played"
-)
-print(
-    f"Player {second_player.username} won {second_player.n_won_battles} out of {second_player.n_finished_battles} played"
-)
+battle_format = "gen9vgc2025regh"
 
-# Looping over battles
 
-for battle_tag, battle in firstAgent.battles.items():
-    print(battle_tag, battle.won)
+def agent_factory(battle_format: str):
+    """
+    YourFirstAgent players that each bring a random catalog team of battle_format
+    """
+    team_ids = list(range(team_count(battle_format)))
+
+    def make_agent(**kwargs) -> YourFirstAgent:
+        return YourFirstAgent(team=RandomTeamBuilder(team_ids, battle_format), **kwargs)
+
+    return make_agent
+
+
+async def main(pairs: int, battles_per_pair: int, max_concurrent_battles: int, servers: int, archive: Optional[str]):
+    options = dict(pairs=pairs, battles_per_pair=battles_per_pair, max_concurrent_battles=max_concurrent_battles)
+    writer = BattleArchiveWriter(archive) if archive else None
+    if writer is not None:
+        options["log_sink"] = writer.append
+    try:
+        if servers > 1:
+            # the servers started here get their own ports, not the one `make run` serves on
+            with ServerPool(servers, base_port=8001) as pool:
+                runner = ShardedSelfPlayRunner(agent_factory(battle_format), battle_format, pool.configurations, **options)
+                report = await runner.run()
+            print(report.summary())
+            for server, battles in zip(pool.servers, runner.per_server(report)):
+                print(f"Server on port {server.port} played {battles} battles")
+        else:
+            runner = SelfPlayRunner(agent_factory(battle_format), battle_format, **options)
+            report = await runner.run()
+            print(report.summary())
+    finally:
+        if writer is not None:
+            writer.close()
+    for pair in range(pairs):
+        first = f"{runner.name_prefix}{pair}a"
+        print(f"Player {first} won {report.wins(first)} out of {battles_per_pair} played")
+
+
+if __name__ == "__main__":
+    # python pythonTest.py [pairs] [battles per pair] [max concurrent battles per player] [servers] [archive]
+    # servers > 1 starts that many local servers and spreads the pairs over them; battle logs
+    # are appended to the archive file if one is given (read them with battle_archive.py)
+    args = [int(arg) for arg in sys.argv[1:5]]
+    archive = sys.argv[5] if len(sys.argv) > 5 else None
+    asyncio.run(main(*args, *(4, 25, 4, 1)[len(args) :], archive))
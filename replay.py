@@ -0,0 +1,192 @@
+"""
+Offline replay of recorded battles into an agent, without a server.
+
+A battle log is the websocket frames one player received for a battle, in order, each frame
+a ">battle-..." room line followed by its protocol lines (|request| included). LogRecorder
+captures them from a live player; ReplayHarness feeds them back into a fresh DoubleBattle
+the way Player._handle_battle_message does and asks the agent for a choice at every request
+that wants one, so the agent sees the same battle states and requests it saw live, at
+whatever speed its decisions run, e.g.
+
+    python replay.py mcts logs/*.log
+
+prints the agent's decisions per second over every logged battle. Choices are not sent
+anywhere: whatever the agent picks, the battle goes on as it was recorded.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+import orjson
+from poke_env.battle import AbstractBattle, DoubleBattle
+from poke_env.data import GenData
+from poke_env.player import Player
+
+# battle tag, and the frames of the battle as received
+LogSink = Callable[[str, list[str]], None]
+
+
+class Decision(NamedTuple):
+    battle_tag: str
+    turn: int
+    message: str  # the choice as it would have been sent, e.g. "/choose move 1 2, switch 3"
+    seconds: float
+
+
+def frames(lines: Iterable[str]) -> Iterator[str]:
+    """
+    The frames of a battle log, from its lines
+    """
+    frame: list[str] = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if line.startswith(">") and frame:
+            yield "\n".join(frame)
+            frame = []
+        if line or frame:
+            frame.append(line)
+    if frame:
+        yield "\n".join(frame)
+
+
+def read_log(path: str) -> list[str]:
+    with open(path) as f:
+        return list(frames(f))
+
+
+def _username(split_frames: list[list[list[str]]]) -> Optional[str]:
+    # requests name the side they are sent to
+    for split_messages in split_frames:
+        for split_message in split_messages[1:]:
+            if len(split_message) > 2 and split_message[1] == "request" and split_message[2]:
+                return json.loads(split_message[2])["side"]["name"]
+    return None
+
+
+class LogRecorder:
+    def __init__(self, player: Player, directory: Optional[str] = None, sink: Optional[LogSink] = None):
+        """
+        Captures the frames of every battle player plays and hands each finished battle's
+        to sink, by default writing them to directory/<battle tag>.log
+        """
+        assert directory is not None or sink is not None
+        self.directory = directory
+        self.sink = sink or self.write
+        self.battles: dict[str, list[str]] = {}
+        handle = player.ps_client._handle_battle_message
+
+        async def handle_battle_message(split_messages: list[list[str]]):
+            battle_tag = split_messages[0][0][1:]
+            self.battles.setdefault(battle_tag, []).append("\n".join("|".join(message) for message in split_messages))
+            try:
+                await handle(split_messages)
+            finally:
+                if any(len(message) > 1 and message[1] in ("win", "tie") for message in split_messages[1:]):
+                    self.sink(battle_tag, self.battles.pop(battle_tag))
+
+        player.ps_client._handle_battle_message = handle_battle_message
+
+    def write(self, battle_tag: str, battle_frames: list[str]):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, battle_tag + ".log"), "w") as f:
+            f.write("\n".join(battle_frames) + "\n")
+
+
+class ReplayHarness:
+    def __init__(self, player: Player):
+        """
+        player only decides: make it with start_listening=False so it never connects
+        """
+        self.player = player
+        self.logger = logging.getLogger("replay")
+        self.decisions: list[Decision] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def close(self):
+        if self._loop is not None:
+            self._loop.close()
+            self._loop = None
+
+    def decide(self, battle: AbstractBattle) -> str:
+        start = time.perf_counter()
+        if battle.teampreview:
+            message = self.player.teampreview(battle)
+        else:
+            choice = self.player.choose_move(battle)
+            if asyncio.iscoroutine(choice) or isinstance(choice, asyncio.Future):
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                choice = self._loop.run_until_complete(choice)
+            message = choice.message
+        self.decisions.append(Decision(battle.battle_tag, battle.turn, message, time.perf_counter() - start))
+        return message
+
+    def replay(self, battle_frames: list[str]) -> AbstractBattle:
+        """
+        Plays one battle's frames into a new DoubleBattle, deciding at every request
+        """
+        split_frames = [[message.split("|") for message in frame.split("\n")] for frame in battle_frames]
+        battle_tag = split_frames[0][0][0][1:]
+        battle = DoubleBattle(
+            battle_tag=battle_tag,
+            username=_username(split_frames) or self.player.username,
+            logger=self.logger,
+            gen=GenData.from_format(battle_tag.split("-")[1]).gen,
+        )
+        for split_messages in split_frames:
+            for split_message in split_messages[1:]:
+                if len(split_message) < 2:
+                    continue
+                kind = split_message[1]
+                if kind == "":
+                    battle.parse_message(split_message)
+                elif kind in Player.MESSAGES_TO_IGNORE or kind in ("error", "bigerror", "showteam"):
+                    # errors answer choices that were never sent, and open team sheets are
+                    # not replayed
+                    pass
+                elif kind == "request":
+                    if split_message[2]:
+                        battle.parse_request(orjson.loads(split_message[2]))
+                        if not battle._wait:
+                            self.decide(battle)
+                elif kind == "win" or kind == "tie":
+                    if kind == "win":
+                        battle.won_by(split_message[2])
+                    else:
+                        battle.tied()
+                    self.player._battle_finished_callback(battle)
+                else:
+                    battle.parse_message(split_message)
+        return battle
+
+    def replay_many(self, logs: Iterable[list[str]]) -> list[Decision]:
+        """
+        The decisions taken over every battle in logs
+        """
+        start = len(self.decisions)
+        for battle_frames in logs:
+            self.replay(battle_frames)
+        return self.decisions[start:]
+
+
+if __name__ == "__main__":
+    # python replay.py [agent] logs...
+    from benchmark import AGENTS, BATTLE_FORMAT
+
+    agent, paths = sys.argv[1], sys.argv[2:]
+    harness = ReplayHarness(AGENTS[agent](battle_format=BATTLE_FORMAT, start_listening=False))
+    start = time.perf_counter()
+    decisions = harness.replay_many(read_log(path) for path in paths)
+    seconds = time.perf_counter() - start
+    harness.close()
+    thinking = sum(decision.seconds for decision in decisions)
+    print(
+        f"{len(decisions)} decisions over {len(paths)} battles in {seconds:.2f}s: "
+        f"{len(decisions) / seconds if seconds else 0:.0f} decisions/s, "
+        f"{thinking / len(decisions) * 1000 if decisions else 0:.2f} ms deciding each"
+    )
@@ -0,0 +1,137 @@
+"""
+Fast resolution of teams.find_run_id.
+
+A run id seeds random.Random(run_id).shuffle over the team indices, so the team order of a
+run only depends on the number of teams. RunIdTable stores the first `depth` teams of the
+first `runs` run ids per team count (`python run_ids.py gen9vgc2025regh` writes it next to
+the catalog), and queries are answered by one vectorized compare. Subsets the table does
+not cover fall back to search_run_id, which replays random.shuffle but gives up on a run id
+as soon as one of the wanted teams lands outside the prefix.
+"""
+
+import os
+import random
+import sys
+from typing import Optional
+
+import numpy as np
+
+from team_catalog import CATALOG_PATH
+
+RUN_ID_DIR = os.path.dirname(CATALOG_PATH)
+
+
+def _prefix_is(rng: random.Random, n: int, team_ids: set[int]) -> bool:
+    # same Fisher-Yates walk as random.shuffle, so the random stream is consumed identically;
+    # position i is final once swapped, so the prefix can only match if every position
+    # outside it receives a team that is not wanted
+    k = len(team_ids)
+    order = list(range(n))
+    randbelow = rng._randbelow
+    for i in range(n - 1, k - 1, -1):
+        if i == 0:
+            break
+        j = randbelow(i + 1)
+        order[i], order[j] = order[j], order[i]
+        if order[i] in team_ids:
+            return False
+    return True
+
+
+def search_run_id(team_ids: set[int], n: int, start: int = 1) -> int:
+    """
+    Lowest run_id >= start whose shuffle of range(n) starts with team_ids
+    """
+    if not team_ids <= set(range(n)):
+        raise ValueError(f"team ids {sorted(team_ids)} are not all below {n}")
+    run_id = start
+    while not _prefix_is(random.Random(run_id), n, team_ids):
+        run_id += 1
+    return run_id
+
+
+def table_path(n: int, directory: str = RUN_ID_DIR) -> str:
+    return os.path.join(directory, f"run_ids_{n}.npy")
+
+
+class RunIdTable:
+    def __init__(self, n: int, prefixes: np.ndarray):
+        """
+        prefixes[r] holds the first teams of run id r + 1
+        """
+        self.n = n
+        self.prefixes = prefixes
+        self._sorted: dict[int, np.ndarray] = {}
+
+    @property
+    def runs(self) -> int:
+        return len(self.prefixes)
+
+    @property
+    def depth(self) -> int:
+        return self.prefixes.shape[1]
+
+    @classmethod
+    def build(cls, n: int, runs: int = 100_000, depth: int = 6) -> "RunIdTable":
+        depth = min(depth, n)
+        prefixes = np.empty((runs, depth), dtype=np.uint16)
+        for run_id in range(1, runs + 1):
+            teams = list(range(n))
+            random.Random(run_id).shuffle(teams)
+            prefixes[run_id - 1] = teams[:depth]
+        return cls(n, prefixes)
+
+    @classmethod
+    def load(cls, n: int, directory: str = RUN_ID_DIR) -> Optional["RunIdTable"]:
+        try:
+            return cls(n, np.load(table_path(n, directory), mmap_mode="r"))
+        except OSError:
+            return None
+
+    def save(self, directory: str = RUN_ID_DIR) -> str:
+        path = table_path(self.n, directory)
+        tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+        np.save(tmp_path, np.ascontiguousarray(self.prefixes))
+        os.replace(tmp_path, path)
+        return path
+
+    def lookup(self, team_ids: set[int]) -> Optional[int]:
+        """
+        Lowest run id in the table starting with team_ids, None if the table cannot tell
+        """
+        k = len(team_ids)
+        if k == 0:
+            return 1
+        if k > self.depth:
+            return None
+        if k not in self._sorted:
+            self._sorted[k] = np.sort(self.prefixes[:, :k], axis=1)
+        hits = np.flatnonzero((self._sorted[k] == sorted(team_ids)).all(axis=1))
+        return int(hits[0]) + 1 if len(hits) else None
+
+
+_tables: dict[int, Optional[RunIdTable]] = {}
+
+
+def find_run_id(team_ids: set[int], n: int) -> int:
+    """
+    Lowest run_id > 0 whose shuffle of range(n) starts with team_ids
+    """
+    if n not in _tables:
+        _tables[n] = RunIdTable.load(n)
+    table = _tables[n]
+    if table is None:
+        return search_run_id(team_ids, n)
+    run_id = table.lookup(team_ids)
+    if run_id is None:
+        # a subset deeper than the table may still start a run id the table holds
+        start = table.runs + 1 if len(team_ids) <= table.depth else 1
+        run_id = search_run_id(team_ids, n, start=start)
+    return run_id
+
+
+if __name__ == "__main__":
+    from teams import team_count
+
+    for battle_format in sys.argv[1:]:
+        print(f"wrote {RunIdTable.build(team_count(battle_format)).save()}")
@@ -0,0 +1,163 @@
+"""
+Concurrent self-play against local Showdown servers.
+
+SelfPlayRunner starts pairs of players on one event loop and has every pair play its
+battles against each other at the same time, each player holding up to
+max_concurrent_battles battles open, so one process keeps the server busy instead of
+waiting on one battle at a time. Results are recorded as each battle finishes (the first
+player of a pair reports them) and summed up in a SelfPlayReport.
+"""
+
+import asyncio
+import time
+from typing import Callable, NamedTuple, Optional
+
+from poke_env.battle import AbstractBattle
+from poke_env.player import Player
+from poke_env.ps_client import AccountConfiguration, LocalhostServerConfiguration, ServerConfiguration
+
+from replay import LogRecorder, LogSink
+
+# keyword arguments: account_configuration, battle_format, max_concurrent_battles,
+# server_configuration; e.g. a Player subclass or a functools.partial of one with a team
+PlayerFactory = Callable[..., Player]
+
+
+class BattleResult(NamedTuple):
+    battle_tag: str
+    pair: int
+    winner: Optional[str]  # username, None for a tie
+    turns: int
+    finished: float  # seconds since the run started
+
+
+class SelfPlayReport(NamedTuple):
+    results: list[BattleResult]
+    seconds: float
+
+    @property
+    def battles(self) -> int:
+        return len(self.results)
+
+    @property
+    def battles_per_second(self) -> float:
+        return self.battles / self.seconds if self.seconds else 0.0
+
+    def wins(self, username: str) -> int:
+        return sum(result.winner == username for result in self.results)
+
+    def summary(self) -> str:
+        turns = sum(result.turns for result in self.results)
+        return (
+            f"{self.battles} battles ({turns} turns) in {self.seconds:.1f}s: "
+            f"{self.battles_per_second:.2f} battles/s, {turns / self.seconds if self.seconds else 0:.1f} turns/s"
+        )
+
+
+class SelfPlayRunner:
+    def __init__(
+        self,
+        player_factory: PlayerFactory,
+        battle_format: str,
+        pairs: int = 4,
+        battles_per_pair: int = 25,
+        max_concurrent_battles: int = 4,
+        opponent_factory: Optional[PlayerFactory] = None,
+        server_configuration: ServerConfiguration = LocalhostServerConfiguration,
+        name_prefix: str = "selfplay",
+        on_result: Optional[Callable[[BattleResult], None]] = None,
+        log_sink: Optional[LogSink] = None,
+    ):
+        """
+        Each of pairs pairs plays battles_per_pair battles, up to max_concurrent_battles of
+        them at once; the second player of a pair comes from opponent_factory if given.
+        Usernames are name_prefix followed by the pair and side, so runs sharing a server
+        need distinct prefixes. on_result is called with every result as it comes in, and
+        log_sink (e.g. a battle_archive.BattleArchiveWriter's append) with the log of every
+        battle as the first player of its pair saw it.
+        """
+        assert pairs > 0 and battles_per_pair > 0 and max_concurrent_battles > 0
+        self.player_factory = player_factory
+        self.opponent_factory = opponent_factory or player_factory
+        self.battle_format = battle_format
+        self.pairs = pairs
+        self.battles_per_pair = battles_per_pair
+        self.max_concurrent_battles = max_concurrent_battles
+        self.server_configuration = server_configuration
+        self.name_prefix = name_prefix
+        self.on_result = on_result
+        self.log_sink = log_sink
+        self.results: list[BattleResult] = []
+        self._start = 0.0
+
+    def server_for(self, pair: int) -> ServerConfiguration:
+        """
+        Server the players of pair connect to
+        """
+        return self.server_configuration
+
+    def player_options(self, pair: int, side: int) -> dict:
+        """
+        Extra factory keyword arguments for the player on side (0 or 1) of pair
+        """
+        return {}
+
+    def make_pair(self, pair: int) -> tuple[Player, Player]:
+        server = self.server_for(pair)
+        players = []
+        for side, factory in enumerate((self.player_factory, self.opponent_factory)):
+            players.append(
+                factory(
+                    account_configuration=AccountConfiguration(f"{self.name_prefix}{pair}{'ab'[side]}", None),
+                    battle_format=self.battle_format,
+                    max_concurrent_battles=self.max_concurrent_battles,
+                    server_configuration=server,
+                    **self.player_options(pair, side),
+                )
+            )
+        self._report_results(players[0], pair)
+        if self.log_sink is not None:
+            LogRecorder(players[0], sink=self.log_sink)
+        return players[0], players[1]
+
+    def _report_results(self, player: Player, pair: int):
+        # wraps the instance's callback, so subclasses' own bookkeeping still runs
+        finished = player._battle_finished_callback
+
+        def battle_finished(battle: AbstractBattle):
+            finished(battle)
+            self.record(battle, pair)
+
+        player._battle_finished_callback = battle_finished
+
+    def record(self, battle: AbstractBattle, pair: int):
+        if battle.won:
+            winner = battle.player_username
+        elif battle.lost:
+            winner = battle.opponent_username
+        else:
+            winner = None
+        result = BattleResult(battle.battle_tag, pair, winner, battle.turn, time.perf_counter() - self._start)
+        self.results.append(result)
+        if self.on_result is not None:
+            self.on_result(result)
+
+    async def play_pair(self, pair: int, first: Player, second: Player):
+        await first.battle_against(second, n_battles=self.battles_per_pair)
+
+    async def run_pair(self, pair: int):
+        """
+        Connects the players of pair, plays its battles and disconnects them
+        """
+        players = self.make_pair(pair)
+        try:
+            await self.play_pair(pair, *players)
+        finally:
+            # players that never connected fail to stop; that must not hide the run's own error
+            await asyncio.gather(*(player.ps_client.stop_listening() for player in players), return_exceptions=True)
+
+    async def run(self) -> SelfPlayReport:
+        self.results = []
+        self._start = time.perf_counter()
+        await asyncio.gather(*(self.run_pair(pair) for pair in range(self.pairs)))
+        return SelfPlayReport(list(self.results), time.perf_counter() - self._start)
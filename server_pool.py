@@ -0,0 +1,179 @@
+"""
+Several local Showdown servers, with self-play pairs spread over them.
+
+A Showdown server runs its battles on one node process, so past a few concurrent battles a
+single server is what self-play waits on. ServerPool starts K servers from the
+pokemon-showdown checkout on consecutive ports and ShardedSelfPlayRunner starts pairs of
+players a few at a time, connecting each to the server with the fewest battles still to
+play when it starts, so throughput grows with the cores the servers get and a slow server
+gets fewer pairs. The run's report counts all servers together; per_server splits it back
+up.
+
+    python server_pool.py [servers] [base port]
+
+keeps a pool up until interrupted, for runners in other processes.
+"""
+
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Optional, Sequence
+
+from poke_env.battle import AbstractBattle
+from poke_env.ps_client import LocalhostServerConfiguration, ServerConfiguration
+
+from selfplay import PlayerFactory, SelfPlayReport, SelfPlayRunner
+
+SHOWDOWN_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pokemon-showdown-master")
+BASE_PORT = 8000
+
+
+def server_configuration(port: int) -> ServerConfiguration:
+    return ServerConfiguration(
+        f"ws://localhost:{port}/showdown/websocket", LocalhostServerConfiguration.authentication_url
+    )
+
+
+class ShowdownServer:
+    """
+    One pokemon-showdown process serving on port, without login security
+    """
+
+    def __init__(self, port: int, directory: str = SHOWDOWN_PATH):
+        self.port = port
+        self.configuration = server_configuration(port)
+        self.process = subprocess.Popen(
+            ["node", "pokemon-showdown", "start", "--no-security", str(port)],
+            cwd=directory,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def wait_ready(self, timeout: float = 60.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"showdown on port {self.port} exited with {self.process.returncode}")
+            try:
+                with socket.create_connection(("localhost", self.port), timeout=1.0):
+                    return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"showdown on port {self.port} did not start within {timeout}s")
+                time.sleep(0.2)
+
+    def close(self):
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+
+class ServerPool:
+    def __init__(self, servers: int = os.cpu_count() or 1, base_port: int = BASE_PORT, directory: str = SHOWDOWN_PATH):
+        """
+        Starts servers servers on ports base_port onwards and waits until all accept
+        connections; the first build of a fresh checkout can take a while
+        """
+        assert servers > 0
+        self.servers = [ShowdownServer(base_port + i, directory) for i in range(servers)]
+        try:
+            for server in self.servers:
+                server.wait_ready()
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> "ServerPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def configurations(self) -> list[ServerConfiguration]:
+        return [server.configuration for server in self.servers]
+
+    def close(self):
+        for server in self.servers:
+            server.close()
+
+
+class ShardedSelfPlayRunner(SelfPlayRunner):
+    def __init__(
+        self,
+        player_factory: PlayerFactory,
+        battle_format: str,
+        servers: Sequence[ServerConfiguration],
+        active_pairs: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        SelfPlayRunner that plays at most active_pairs pairs at a time (two per server by
+        default) and connects each pair, when it starts, to the one of servers with the
+        fewest battles assigned and not yet finished
+        """
+        assert servers
+        super().__init__(player_factory, battle_format, **kwargs)
+        self.servers = list(servers)
+        self.active_pairs = active_pairs or 2 * len(self.servers)
+        self.load = [0] * len(self.servers)
+        self.pair_server: dict[int, int] = {}
+        # battles of each running pair not yet finished
+        self.remaining: dict[int, int] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def server_for(self, pair: int) -> ServerConfiguration:
+        server = min(range(len(self.servers)), key=self.load.__getitem__)
+        self.load[server] += self.battles_per_pair
+        self.remaining[pair] = self.battles_per_pair
+        self.pair_server[pair] = server
+        return self.servers[server]
+
+    def record(self, battle: AbstractBattle, pair: int):
+        self.load[self.pair_server[pair]] -= 1
+        self.remaining[pair] -= 1
+        super().record(battle, pair)
+
+    async def run_pair(self, pair: int):
+        async with self._slots:
+            try:
+                await super().run_pair(pair)
+            finally:
+                # battles a failed pair never finished no longer weigh on its server
+                if pair in self.remaining:
+                    self.load[self.pair_server[pair]] -= self.remaining.pop(pair)
+
+    async def run(self) -> SelfPlayReport:
+        self.load = [0] * len(self.servers)
+        self.pair_server = {}
+        self.remaining = {}
+        self._slots = asyncio.Semaphore(self.active_pairs)
+        return await super().run()
+
+    def per_server(self, report: Optional[SelfPlayReport] = None) -> list[int]:
+        """
+        Battles finished on each server, in the order of servers
+        """
+        battles = [0] * len(self.servers)
+        for result in (report or SelfPlayReport(self.results, 0.0)).results:
+            battles[self.pair_server[result.pair]] += 1
+        return battles
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:3]]
+    count, base_port = (*args, *(os.cpu_count() or 1, BASE_PORT)[len(args) :])
+    with ServerPool(count, base_port) as pool:
+        print("serving on ports", ", ".join(str(server.port) for server in pool.servers))
+        try:
+            while all(server.process.poll() is None for server in pool.servers):
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
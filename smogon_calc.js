@@ -0,0 +1,26 @@
+// Line-delimited JSON bridge to @smogon/calc: every line read from stdin is a JSON list of
+// queries (see damage_calc.smogon_query) and is answered by one line holding the 16 damage
+// rolls of each query in order, or null for a query the calc rejects. Lines are answered
+// in the order they arrive, so callers can pipeline them (see calc_pool.py).
+import {createInterface} from 'node:readline';
+import {calculate, Field, Generations, Move, Pokemon} from '@smogon/calc';
+
+const gen = Generations.get(9);
+
+function rolls(query) {
+  try {
+    const attacker = new Pokemon(gen, query.attacker.species, query.attacker);
+    const defender = new Pokemon(gen, query.defender.species, query.defender);
+    const move = new Move(gen, query.move.name, query.move);
+    const damage = calculate(gen, attacker, defender, move, new Field(query.field)).damage;
+    return typeof damage === 'number' ? new Array(16).fill(damage) : damage;
+  } catch (error) {
+    return null;
+  }
+}
+
+for await (const line of createInterface({input: process.stdin})) {
+  if (line.trim()) {
+    process.stdout.write(JSON.stringify(JSON.parse(line).map(rolls)) + '\n');
+  }
+}
@@ -0,0 +1,111 @@
+"""
+Process-wide memo of Teambuilder.parse_showdown_team / join_team results.
+
+Entries are keyed on a hash of the paste text, kept in a bounded LRU and optionally
+backed by a sqlite file so that separate processes (or later runs) share the work.
+Parsed lists are shared between callers and must be treated as read-only.
+"""
+
+import hashlib
+import os
+import pickle
+import sqlite3
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from poke_env.teambuilder import Teambuilder, TeambuilderPokemon
+
+
+def team_key(team: str) -> bytes:
+    return hashlib.blake2b(team.encode("utf-8"), digest_size=16).digest()
+
+
+class ParsedTeam(NamedTuple):
+    mons: list[TeambuilderPokemon]
+    packed: str
+
+
+class TeamCache:
+    def __init__(self, maxsize: int = 1024, path: Optional[str] = None):
+        assert maxsize > 0
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[bytes, ParsedTeam] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_pid: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections must not cross a fork, so reopen in child processes
+        if self._db is None or self._db_pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS teams (key BLOB PRIMARY KEY, packed TEXT, mons BLOB)"
+            )
+            self._db_pid = os.getpid()
+        return self._db
+
+    def get(self, team: str) -> ParsedTeam:
+        key = team_key(team)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        row = None
+        if self.path is not None:
+            row = self._connection().execute("SELECT packed, mons FROM teams WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            entry = ParsedTeam(pickle.loads(row[1]), row[0])
+            self.disk_hits += 1
+        else:
+            mons = Teambuilder.parse_showdown_team(team)
+            entry = ParsedTeam(mons, Teambuilder.join_team(mons))
+            self.misses += 1
+            if self.path is not None:
+                self._connection().execute(
+                    "INSERT OR IGNORE INTO teams VALUES (?, ?, ?)",
+                    (key, entry.packed, pickle.dumps(entry.mons, protocol=pickle.HIGHEST_PROTOCOL)),
+                )
+
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def parsed(self, team: str) -> list[TeambuilderPokemon]:
+        return self.get(team).mons
+
+    def packed(self, team: str) -> str:
+        return self.get(team).packed
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+
+TEAM_CACHE = TeamCache()
+
+
+def configure_team_cache(maxsize: int = 1024, path: Optional[str] = None) -> TeamCache:
+    """
+    Replaces the process-wide cache, e.g. to enable the on-disk tier at path
+    """
+    global TEAM_CACHE
+    TEAM_CACHE = TeamCache(maxsize, path)
+    return TEAM_CACHE
+
+
+def parse_team(team: str) -> list[TeambuilderPokemon]:
+    return TEAM_CACHE.parsed(team)
+
+
+def pack_team(team: str) -> str:
+    return TEAM_CACHE.packed(team)
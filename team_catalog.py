@@ -0,0 +1,345 @@
+"""
+Compiled, memory-mapped catalog of the tournament teams in team_data.py.
+
+`python team_catalog.py` (or `make catalog`) compiles every regulation of TEAMS into a
+single binary file holding the original pastes, the packed Showdown strings and one
+fixed-size record per mon. Workers then mmap that file instead of importing the
+18k-line literal and re-parsing it, so every process on a box shares the same pages.
+
+File layout (little endian):
+    magic (8 bytes) | version (u32) | header length (u32) | JSON header | sections
+String sections are a u32 offset table (count + 1 entries) followed by a utf-8 blob.
+Mon sections are `MON_DTYPE_SPEC` records, 6 per team, 0 being the id of a missing string.
+"""
+
+import ast
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tokenize
+from collections.abc import Mapping
+from typing import Iterator, NamedTuple, Optional
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "teams.catalog")
+SOURCE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "team_data.py")
+
+MAGIC = b"PSTEAMS\x00"
+VERSION = 2
+TEAM_SIZE = 6
+MAX_MOVES = 4
+
+_PREAMBLE = struct.Struct("<8sII")
+_MON_FIELDS = ("name", "species", "nickname", "item", "ability", "tera_type", "nature")
+MON_DTYPE_SPEC = [
+    *[(field, "<u2") for field in _MON_FIELDS],
+    ("level", "u1"),
+    ("evs", "<u2", (6,)),
+    ("ivs", "u1", (6,)),
+    ("moves", "<u2", (MAX_MOVES,)),
+]
+_MON_RECORD = struct.Struct(f"<{len(_MON_FIELDS)}HB6H6B{MAX_MOVES}H")
+
+
+def source_hash(path: str = SOURCE_PATH) -> str:
+    """
+    Hash of the team source file, used to detect a stale catalog
+    """
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class Event(NamedTuple):
+    name: Optional[str]
+    start: int
+    count: int
+
+
+def _source_events(path: str = SOURCE_PATH) -> dict[str, list[Event]]:
+    """
+    Reads the `### EVENT (n teams) ###` comments of the team source, which the literal drops
+    """
+    events: dict[str, list[Event]] = {}
+    regulation = None
+    depth = 0
+    with open(path, "rb") as f:
+        tokens = list(tokenize.tokenize(f.readline))
+    for token, next_token in zip(tokens, tokens[1:]):
+        if token.type == tokenize.OP and token.string in "[{(":
+            depth += 1
+        elif token.type == tokenize.OP and token.string in "]})":
+            depth -= 1
+        elif depth == 1 and token.type == tokenize.STRING and next_token.string == ":":
+            regulation = ast.literal_eval(token.string)
+            events[regulation] = []
+        elif depth == 2 and token.type == tokenize.COMMENT and token.string.startswith("###"):
+            name = token.string.strip("#").strip()
+            start = sum(event.count for event in events[regulation])
+            events[regulation].append(Event(name, start, 0))
+        elif depth == 2 and token.type == tokenize.STRING:
+            if not events[regulation]:
+                events[regulation].append(Event(None, 0, 0))
+            events[regulation][-1] = events[regulation][-1]._replace(count=events[regulation][-1].count + 1)
+    return events
+
+
+class _StringTable:
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.values: list[str] = [""]
+
+    def id(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        if value not in self.ids:
+            self.ids[value] = len(self.values)
+            self.values.append(value)
+        return self.ids[value]
+
+
+def _pack_strings(values: list[str]) -> bytes:
+    blobs = [v.encode("utf-8") for v in values]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(blobs)
+
+
+def _align(buffer: bytearray, alignment: int = 8):
+    buffer.extend(b"\x00" * (-len(buffer) % alignment))
+
+
+def build_catalog(path: str = CATALOG_PATH) -> str:
+    """
+    Compiles team_data.TEAMS into a binary catalog at path and returns the path
+    """
+    from poke_env.teambuilder import Teambuilder
+
+    from team_data import TEAMS
+
+    events = _source_events()
+    strings = _StringTable()
+    sections: list[tuple[str, bytes]] = []
+    regulations = {}
+    for regulation, teams in TEAMS.items():
+        packed_teams = []
+        mon_records = bytearray()
+        for team in teams:
+            mons = Teambuilder.parse_showdown_team(team)
+            assert len(mons) == TEAM_SIZE, f"{regulation} team has {len(mons)} mons"
+            for mon in mons:
+                assert len(mon.moves) <= MAX_MOVES, f"{mon.species or mon.nickname} has too many moves"
+                moves = [strings.id(move) for move in mon.moves]
+                mon_records += _MON_RECORD.pack(
+                    strings.id(mon.species or mon.nickname),
+                    *[strings.id(getattr(mon, field)) for field in _MON_FIELDS[1:]],
+                    mon.level or 0,
+                    *mon.evs,
+                    *mon.ivs,
+                    *(moves + [0] * (MAX_MOVES - len(moves))),
+                )
+            packed_teams.append(Teambuilder.join_team(mons))
+        assert sum(event.count for event in events[regulation]) == len(teams)
+        regulations[regulation] = {"count": len(teams), "events": events[regulation]}
+        sections.append((f"{regulation}.texts", _pack_strings(list(teams))))
+        sections.append((f"{regulation}.packed", _pack_strings(packed_teams)))
+        sections.append((f"{regulation}.mons", bytes(mon_records)))
+    sections.append(("strings", _pack_strings(strings.values)))
+
+    # section offsets are relative to the end of the header so the header can describe itself
+    body = bytearray()
+    offsets = {}
+    for name, data in sections:
+        _align(body)
+        offsets[name] = [len(body), len(data)]
+        body += data
+    header = json.dumps(
+        {
+            "source_hash": source_hash(),
+            "strings": len(strings.values),
+            "regulations": regulations,
+            "sections": offsets,
+        }
+    ).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % 8)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        f.write(header)
+        f.write(body)
+    os.replace(tmp_path, path)
+    return path
+
+
+class _MappedStrings:
+    """
+    Lazily decoded view of a string section
+    """
+
+    def __init__(self, buffer: memoryview, count: int):
+        self._offsets = buffer[: 4 * (count + 1)].cast("I")
+        self._blob = buffer[4 * (count + 1) :]
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        if not -self._count <= i < self._count:
+            raise IndexError(i)
+        i %= self._count
+        return str(self._blob[self._offsets[i] : self._offsets[i + 1]], "utf-8")
+
+
+class CatalogRegulation:
+    """
+    Teams of one regulation; indexing returns the original Showdown paste
+    """
+
+    def __init__(self, catalog: "TeamCatalog", name: str, count: int):
+        self.catalog = catalog
+        self.name = name
+        self._count = count
+        self._texts = _MappedStrings(catalog.section(f"{name}.texts"), count)
+        self._packed = _MappedStrings(catalog.section(f"{name}.packed"), count)
+        self._mons = None
+        self.events = [Event(*event) for event in catalog.header["regulations"][name]["events"]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> str:
+        return self._texts[i]
+
+    def __iter__(self):
+        return (self._texts[i] for i in range(self._count))
+
+    def packed(self, i: int) -> str:
+        """
+        Packed-format team i, identical to Teambuilder.join_team(parse_showdown_team(...))
+        """
+        return self._packed[i]
+
+    def event_of(self, i: int) -> Event:
+        for event in self.events:
+            if event.start <= i < event.start + event.count:
+                return event
+        raise IndexError(i)
+
+    @property
+    def mons(self):
+        """
+        Structured numpy array of shape (len(self), 6) over the mapped mon records
+        """
+        if self._mons is None:
+            import numpy as np  # only the array consumers pay for numpy
+
+            self._mons = np.frombuffer(
+                self.catalog.section(f"{self.name}.mons"), dtype=np.dtype(MON_DTYPE_SPEC)
+            ).reshape(self._count, TEAM_SIZE)
+        return self._mons
+
+
+class TeamCatalog:
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+        magic, version, header_len = _PREAMBLE.unpack_from(self._buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} team catalog")
+        self.header = json.loads(bytes(self._buffer[_PREAMBLE.size : _PREAMBLE.size + header_len]))
+        self._body = self._buffer[_PREAMBLE.size + header_len :]
+        self._regulations: dict[str, CatalogRegulation] = {}
+        self._strings = None
+
+    @property
+    def regulations(self) -> list[str]:
+        return list(self.header["regulations"])
+
+    def section(self, name: str) -> memoryview:
+        offset, length = self.header["sections"][name]
+        return self._body[offset : offset + length]
+
+    def string(self, string_id: int) -> Optional[str]:
+        """
+        Resolves an id from a mon record back to its string, 0 being None
+        """
+        if self._strings is None:
+            self._strings = _MappedStrings(self.section("strings"), self.header["strings"])
+        return self._strings[string_id] if string_id else None
+
+    def __getitem__(self, regulation: str) -> CatalogRegulation:
+        if regulation not in self._regulations:
+            if regulation not in self.header["regulations"]:
+                raise KeyError(regulation)
+            count = self.header["regulations"][regulation]["count"]
+            self._regulations[regulation] = CatalogRegulation(self, regulation, count)
+        return self._regulations[regulation]
+
+    def __contains__(self, regulation: str) -> bool:
+        return regulation in self.header["regulations"]
+
+
+_catalogs: dict[str, TeamCatalog] = {}
+
+
+def load_catalog(path: str = CATALOG_PATH) -> TeamCatalog:
+    """
+    Returns the process-wide catalog at path, (re)building it if missing or stale
+    """
+    if path not in _catalogs:
+        try:
+            catalog = TeamCatalog(path)
+        except (OSError, ValueError):
+            catalog = None
+        # a deployed catalog without its source is trusted as is
+        if catalog is None or (
+            os.path.exists(SOURCE_PATH) and catalog.header["source_hash"] != source_hash()
+        ):
+            build_catalog(path)
+            catalog = TeamCatalog(path)
+        _catalogs[path] = catalog
+    return _catalogs[path]
+
+
+def regulation_for(battle_format: str) -> str:
+    """
+    Maps a battle format such as gen9vgc2025regh to its TEAMS key (regh)
+    """
+    return battle_format[-4:]
+
+
+class LazyTeams(Mapping):
+    """
+    Read-only TEAMS mapping that only decodes a regulation's pastes the first time it is
+    indexed; untouched regulations stay on disk
+    """
+
+    def __init__(self, path: str = CATALOG_PATH):
+        self.path = path
+        self._teams: dict[str, list[str]] = {}
+
+    def __getitem__(self, regulation: str) -> list[str]:
+        if regulation not in self._teams:
+            self._teams[regulation] = list(load_catalog(self.path)[regulation])
+        return self._teams[regulation]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(load_catalog(self.path).regulations)
+
+    def __len__(self) -> int:
+        return len(load_catalog(self.path).regulations)
+
+    def loaded(self) -> list[str]:
+        """
+        Regulations materialized so far
+        """
+        return list(self._teams)
+
+
+if __name__ == "__main__":
+    print(f"wrote {build_catalog()}")
@@ -0,0 +1,112 @@
+"""
+Inverted species index over the catalog for identifying opponents at team preview.
+
+Scores are on calc_team_similarity_score's scale: a species-only query scores each known
+team as if the opponent brought that team's exact sets for every species seen (10/60 per
+shared species), and a full paste is scored exactly against the candidate teams.
+"""
+
+import heapq
+from collections import Counter
+from typing import Iterable, NamedTuple
+
+from poke_env.data import GenData, to_id_str
+
+from team_cache import parse_team
+from team_catalog import load_catalog, regulation_for
+from team_similarity import TeamEncoding, catalog_encoding, encode_teams, similarity_matrix
+
+# 3 exact fields + EVs + nature + IVs + 4 moves, out of the 60 points of a full team
+_POINTS_PER_MON = 10
+_POINTS_PER_TEAM = 60
+
+
+class TeamMatch(NamedTuple):
+    team_id: int
+    score: float
+    overlap: int
+
+
+def _base_species(pokedex: dict, species: str) -> str:
+    entry = pokedex.get(species)
+    return to_id_str(entry["baseSpecies"]) if entry and "baseSpecies" in entry else species
+
+
+class TeamIndex:
+    def __init__(self, regulation: str):
+        self.regulation = regulation
+        self.encoding = catalog_encoding(regulation)
+        catalog = load_catalog()
+        pokedex = GenData.from_gen(9).pokedex
+
+        # each mon is posted under its species id and its base species id, so previews that
+        # hide the form (e.g. Urshifu-*) still match
+        self.postings: dict[str, list[int]] = {}
+        self.species: list[frozenset[str]] = []
+        for team_id, team in enumerate(self.encoding.mons):
+            keys = set()
+            for name_id in team["name"]:
+                species = to_id_str(catalog.string(int(name_id)) or "")
+                keys.add(species)
+                keys.add(_base_species(pokedex, species))
+            for key in keys:
+                self.postings.setdefault(key, []).append(team_id)
+            self.species.append(frozenset(keys))
+
+        self._bits = {key: 1 << i for i, key in enumerate(self.postings)}
+        self.signatures = [sum(self._bits[key] for key in keys) for keys in self.species]
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def signature(self, species: Iterable[str]) -> int:
+        """
+        Bitmask of the indexed species among species; unknown species are ignored
+        """
+        return sum({self._bits[s] for s in map(to_id_str, species) if s in self._bits})
+
+    def query(self, species: Iterable[str], k: int = 5) -> list[TeamMatch]:
+        """
+        Top-k known teams sharing the most species, e.g. with
+        [mon.species for mon in battle.teampreview_opponent_team]
+        """
+        query = self.signature(species)
+        overlaps = Counter()
+        for key, bit in self._bits.items():
+            if query & bit:
+                overlaps.update(self.postings[key])
+        best = heapq.nlargest(k, overlaps.items(), key=lambda item: (item[1], -item[0]))
+        return [
+            TeamMatch(team_id, round(_POINTS_PER_MON * overlap / _POINTS_PER_TEAM, ndigits=3), overlap)
+            for team_id, overlap in best
+        ]
+
+    def query_team(self, team: str, k: int = 5) -> list[TeamMatch]:
+        """
+        Top-k known teams by exact calc_team_similarity_score against a full paste
+        """
+        encoded = encode_teams([team], self.encoding.vocabulary)
+        query = self.signature(mon.species or mon.nickname for mon in parse_team(team))
+        candidates = [t for t, signature in enumerate(self.signatures) if signature & query]
+        if not candidates:
+            return []
+        subset = TeamEncoding(
+            self.encoding.mons[candidates], self.encoding.valid[candidates], self.encoding.vocabulary
+        )
+        scores = similarity_matrix(encoded, subset)[0]
+        overlaps = [(self.signatures[t] & query).bit_count() for t in candidates]
+        matches = [TeamMatch(t, s, o) for t, s, o in zip(candidates, scores.tolist(), overlaps)]
+        return heapq.nlargest(k, matches, key=lambda match: (match.score, -match.team_id))
+
+
+_indexes: dict[str, TeamIndex] = {}
+
+
+def team_index(battle_format: str) -> TeamIndex:
+    """
+    Process-wide index for the regulation of battle_format
+    """
+    regulation = regulation_for(battle_format)
+    if regulation not in _indexes:
+        _indexes[regulation] = TeamIndex(regulation)
+    return _indexes[regulation]
@@ -0,0 +1,133 @@
+"""
+Team samplers for RandomTeamBuilder.
+
+Every sampler draws positions into the builder's team list in O(1) per draw from state
+built once up front, and takes a seed so a league schedule can be replayed exactly.
+"""
+
+import random
+from typing import Optional, Protocol, Sequence
+
+import numpy as np
+
+from team_catalog import load_catalog, regulation_for
+
+
+class TeamSampler(Protocol):
+    def next(self) -> int:
+        ...
+
+
+class AliasSampler:
+    """
+    Weighted draws with replacement through a Vose alias table
+    """
+
+    def __init__(self, weights: Sequence[float], seed: Optional[int] = None):
+        n = len(weights)
+        assert n > 0 and min(weights) >= 0 and sum(weights) > 0
+        total = sum(weights)
+        scaled = [w * n / total for w in weights]
+        self.prob = [1.0] * n
+        self.alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        self._random = random.Random(seed)
+        self._rng = np.random.default_rng(seed)
+        self._prob_array = np.array(self.prob)
+        self._alias_array = np.array(self.alias)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def next(self) -> int:
+        u = self._random.random() * len(self.prob)
+        i = int(u)
+        return i if u - i < self.prob[i] else self.alias[i]
+
+    def sample(self, size: int) -> np.ndarray:
+        """
+        size draws at once, for scheduling many matchups without a Python loop
+        """
+        u = self._rng.random(size) * len(self.prob)
+        i = u.astype(np.int64)
+        return np.where(u - i < self._prob_array[i], i, self._alias_array[i])
+
+
+class StratifiedSampler:
+    """
+    Draws a stratum (e.g. an event), uniformly or by weight, then a team uniformly within it
+    """
+
+    def __init__(
+        self,
+        strata: Sequence[Sequence[int]],
+        weights: Optional[Sequence[float]] = None,
+        seed: Optional[int] = None,
+    ):
+        if weights is None:
+            weights = [1.0] * len(strata)
+        assert len(weights) == len(strata)
+        # an empty stratum is dropped together with its weight
+        kept = [(list(stratum), float(weight)) for stratum, weight in zip(strata, weights) if len(stratum)]
+        strata = [stratum for stratum, _ in kept]
+        self._random = random.Random(seed)
+        self._strata = AliasSampler([weight for _, weight in kept], seed=self._random.getrandbits(64))
+        self._members = [member for stratum in strata for member in stratum]
+        self._offsets = [0]
+        for stratum in strata:
+            self._offsets.append(self._offsets[-1] + len(stratum))
+
+    def next(self) -> int:
+        s = self._strata.next()
+        start = self._offsets[s]
+        return self._members[start + int(self._random.random() * (self._offsets[s + 1] - start))]
+
+
+class PermutationSchedule:
+    """
+    Draws without replacement: every position once per epoch, in a fresh seeded order each epoch
+    """
+
+    def __init__(self, num_teams: int, seed: Optional[int] = None):
+        assert num_teams > 0
+        self._random = random.Random(seed)
+        self._order = list(range(num_teams))
+        self._random.shuffle(self._order)
+        self._cursor = 0
+        self.epoch = 0
+
+    def next(self) -> int:
+        if self._cursor == len(self._order):
+            self._random.shuffle(self._order)
+            self._cursor = 0
+            self.epoch += 1
+        value = self._order[self._cursor]
+        self._cursor += 1
+        return value
+
+
+def event_strata(team_ids: Sequence[int], battle_format: str) -> list[list[int]]:
+    """
+    Positions into team_ids grouped by the event each team was brought to
+    """
+    regulation = load_catalog()[regulation_for(battle_format)]
+    strata: dict[int, list[int]] = {}
+    for position, team_id in enumerate(team_ids):
+        strata.setdefault(regulation.event_of(team_id).start, []).append(position)
+    return list(strata.values())
+
+
+def placement_weights(team_ids: Sequence[int], battle_format: str, decay: float = 1.0) -> list[float]:
+    """
+    Weights favouring better placed teams: teams are listed by placement within their event,
+    and the team placed p-th (from 0) gets weight 1 / (p + 1) ** decay
+    """
+    regulation = load_catalog()[regulation_for(battle_format)]
+    return [1 / (team_id - regulation.event_of(team_id).start + 1) ** decay for team_id in team_ids]
@@ -0,0 +1,105 @@
+"""
+All-pairs version of teams.calc_team_similarity_score over encoded teams.
+
+Teams are encoded once into (N, 6) arrays of string ids (the catalog's mon records, or
+encode_teams for arbitrary pastes) and every pair is scored with batched array ops.
+Contributions are accumulated in the same order as the scalar function and rounded with
+Python's round, so every entry equals calc_team_similarity_score exactly.
+"""
+
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from team_cache import parse_team
+from team_catalog import MAX_MOVES, MON_DTYPE_SPEC, TEAM_SIZE, load_catalog
+
+
+class TeamEncoding(NamedTuple):
+    mons: np.ndarray  # (N, 6) records of MON_DTYPE_SPEC
+    valid: np.ndarray  # (N, 6) False for the padding of teams with fewer than 6 mons
+    vocabulary: dict[str, int]
+
+
+def catalog_encoding(regulation: str) -> TeamEncoding:
+    """
+    Encoding of a catalog regulation, reusing its mapped mon records
+    """
+    catalog = load_catalog()
+    mons = catalog[regulation].mons
+    vocabulary = {catalog.string(i): i for i in range(1, catalog.header["strings"])}
+    return TeamEncoding(mons, np.ones(mons.shape, dtype=bool), vocabulary)
+
+
+def encode_teams(teams: Sequence[str], vocabulary: Optional[dict[str, int]] = None) -> TeamEncoding:
+    """
+    Encodes Showdown pastes; pass another encoding's vocabulary to compare against it
+    """
+    vocabulary = dict(vocabulary or {})
+    next_id = max(vocabulary.values(), default=0) + 1
+
+    def string_id(value: Optional[str]) -> int:
+        nonlocal next_id
+        if value is None:
+            return 0
+        if value not in vocabulary:
+            vocabulary[value] = next_id
+            next_id += 1
+        return vocabulary[value]
+
+    mons = np.zeros((len(teams), TEAM_SIZE), dtype=np.dtype(MON_DTYPE_SPEC))
+    valid = np.zeros((len(teams), TEAM_SIZE), dtype=bool)
+    for t, team in enumerate(teams):
+        for m, mon in enumerate(parse_team(team)):
+            record = mons[t, m]
+            record["name"] = string_id(mon.species or mon.nickname)
+            for field in ("species", "nickname", "item", "ability", "tera_type", "nature"):
+                record[field] = string_id(getattr(mon, field))
+            record["level"] = mon.level or 0
+            record["evs"] = mon.evs
+            record["ivs"] = mon.ivs
+            record["moves"] = [string_id(move) for move in mon.moves] + [0] * (MAX_MOVES - len(mon.moves))
+            valid[t, m] = True
+    return TeamEncoding(mons, valid, vocabulary)
+
+
+def similarity_matrix(teams1: TeamEncoding, teams2: Optional[TeamEncoding] = None) -> np.ndarray:
+    """
+    (N, M) matrix of calc_team_similarity_score(teams1[i], teams2[j]); teams2 defaults to teams1
+    """
+    if teams2 is None:
+        teams2 = teams1
+    mons1, mons2 = teams1.mons, teams2.mons
+    n, m = len(mons1), len(mons2)
+    names1 = mons1["name"].astype(np.int32)
+    names2 = np.where(teams2.valid, mons2["name"].astype(np.int32), -1)
+    evs1, evs2 = mons1["evs"].astype(np.int32), mons2["evs"].astype(np.int32)
+    ivs1, ivs2 = mons1["ivs"].astype(np.int32), mons2["ivs"].astype(np.int32)
+    moves1, moves2 = mons1["moves"].astype(np.int32), mons2["moves"].astype(np.int32)
+    columns = np.arange(m)[None, :]
+
+    score = np.zeros((n, m))
+    for a in range(TEAM_SIZE):
+        # first mon of each team2 sharing the name of mon a of each team1
+        same_name = names1[:, None, a, None] == names2[None, :, :]
+        paired = same_name.any(axis=-1) & teams1.valid[:, a, None]
+        b = same_name.argmax(axis=-1)
+
+        for field in ("item", "ability", "tera_type"):
+            score += paired & (mons1[field][:, a, None] == mons2[field][columns, b])
+        ev_dist = np.abs(evs1[:, None, a, :] - evs2[columns, b]).sum(axis=-1) / (2 * 508)
+        score += np.where(paired, 1 - ev_dist, 0)
+        score += paired & (mons1["nature"][:, a, None] == mons2["nature"][columns, b])
+        iv_dist = np.abs(ivs1[:, None, a, :] - ivs2[columns, b]).sum(axis=-1) / (6 * 31)
+        score += np.where(paired, 1 - iv_dist, 0)
+        paired_moves = moves2[columns, b]
+        for k in range(MAX_MOVES):
+            move = moves1[:, None, a, k, None]
+            score += paired & (move[..., 0] != 0) & (move == paired_moves).any(axis=-1)
+
+    # np.round is not correctly rounded, Python's round is
+    return np.array([round(s, ndigits=3) for s in (score / 60).ravel().tolist()]).reshape(n, m)
+
+
+def regulation_similarity_matrix(regulation: str) -> np.ndarray:
+    return similarity_matrix(catalog_encoding(regulation))